@@ -181,6 +181,10 @@ class AdvancedTradingConfig:
         'update_frequency': int(os.getenv('MARKET_DATA_FREQUENCY', 1))  # seconds
     }
     
+    # Webhook Settings (empty secret disables signature checks)
+    WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET', '')
+    WEBHOOK_MAC = os.getenv('WEBHOOK_MAC', 'hmac-sha256')  # or 'blake2b'
+    
     @classmethod
     def get_broker_config(cls, broker_name: str) -> dict:
         """Get broker configuration by name"""
@@ -293,7 +293,8 @@ class AdvancedTradingEngine:
         try:
             import yfinance as yf
             ticker = yf.Ticker(symbol)
-            info = ticker.info
+            # Blocking HTTP call; keep it off the event loop
+            info = await asyncio.to_thread(lambda: ticker.info)
             
             return {
                 'symbol': symbol,
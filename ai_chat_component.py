@@ -8,7 +8,6 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import json
 import logging
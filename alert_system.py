@@ -1,6 +1,7 @@
 import asyncio
 import schedule
 import time
+import threading
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional
@@ -11,6 +12,9 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Alert types handled by their own checks rather than the breakout check
+_NON_BREAKOUT_TYPES = ('PCR', 'VOLUME')
+
 class AlertSystem:
     def __init__(self):
         self.config = Config()
@@ -18,6 +22,9 @@ class AlertSystem:
         self.oi_analyzer = OIAnalyzer()
         self.active_alerts = {}
         self.alert_history = []
+        # The Streamlit app shares one instance across sessions, so several
+        # monitoring fragments may check alerts at the same time
+        self._lock = threading.Lock()
         
     def setup_breakout_alerts(self, symbol: str, levels: Dict, alert_type: str = "both"):
         """Setup breakout/breakdown alerts for a symbol"""
@@ -48,7 +55,8 @@ class AlertSystem:
                 'breakdown_confirmed': False
             }
             
-            self.active_alerts[alert_id] = alert_config
+            with self._lock:
+                self.active_alerts[alert_id] = alert_config
             logger.info(f"Alert setup for {symbol}: Resistance {nearest_resistance}, Support {nearest_support}")
             
             return alert_id
@@ -61,61 +69,73 @@ class AlertSystem:
         """Check all active alerts for breakouts/breakdowns"""
         alerts_to_remove = []
         
-        for alert_id, alert_config in self.active_alerts.items():
-            if alert_config['status'] != 'ACTIVE':
+        for alert_id, alert_config in self._snapshot():
+            if alert_config['status'] != 'ACTIVE' or alert_config.get('alert_type') in _NON_BREAKOUT_TYPES:
                 continue
                 
             try:
-                symbol = alert_config['symbol']
-                current_data = self.data_fetcher.get_live_price(symbol)
+                current_data = self.data_fetcher.get_live_price(alert_config['symbol'])
                 
-                if not current_data:
-                    continue
+                if current_data and self._check_breakout_alert(alert_config, current_data['price']):
+                    alerts_to_remove.append(alert_id)
+                        
+            except Exception as e:
+                logger.error(f"Error checking alert {alert_id}: {e}")
+        
+        self._archive_alerts(alerts_to_remove)
+    
+    def _check_breakout_alert(self, alert_config: Dict, current_price: float) -> bool:
+        """Check one breakout alert against the current price; True once confirmed"""
+        symbol = alert_config['symbol']
+        nearest_resistance = alert_config['nearest_resistance']
+        nearest_support = alert_config['nearest_support']
+        
+        # Check for breakout
+        if nearest_resistance and current_price > nearest_resistance:
+            if not alert_config['breakout_confirmed']:
+                alert_config['breakout_confirmed'] = True
+                alert_config['breakout_price'] = current_price
+                alert_config['breakout_time'] = datetime.now()
                 
-                current_price = current_data['price']
-                nearest_resistance = alert_config['nearest_resistance']
-                nearest_support = alert_config['nearest_support']
+                # Generate breakout signal
+                signal = self._generate_breakout_signal(symbol, 'BREAKOUT', current_price, nearest_resistance)
+                self._send_alert(signal)
                 
-                # Check for breakout
-                if nearest_resistance and current_price > nearest_resistance:
-                    if not alert_config['breakout_confirmed']:
-                        alert_config['breakout_confirmed'] = True
-                        alert_config['breakout_price'] = current_price
-                        alert_config['breakout_time'] = datetime.now()
-                        
-                        # Generate breakout signal
-                        signal = self._generate_breakout_signal(symbol, 'BREAKOUT', current_price, nearest_resistance)
-                        self._send_alert(signal)
-                        
-                        logger.info(f"BREAKOUT ALERT: {symbol} broke above {nearest_resistance} at {current_price}")
+                logger.info(f"BREAKOUT ALERT: {symbol} broke above {nearest_resistance} at {current_price}")
+        
+        # Check for breakdown
+        elif nearest_support and current_price < nearest_support:
+            if not alert_config['breakdown_confirmed']:
+                alert_config['breakdown_confirmed'] = True
+                alert_config['breakdown_price'] = current_price
+                alert_config['breakdown_time'] = datetime.now()
                 
-                # Check for breakdown
-                elif nearest_support and current_price < nearest_support:
-                    if not alert_config['breakdown_confirmed']:
-                        alert_config['breakdown_confirmed'] = True
-                        alert_config['breakdown_price'] = current_price
-                        alert_config['breakdown_time'] = datetime.now()
-                        
-                        # Generate breakdown signal
-                        signal = self._generate_breakout_signal(symbol, 'BREAKDOWN', current_price, nearest_support)
-                        self._send_alert(signal)
-                        
-                        logger.info(f"BREAKDOWN ALERT: {symbol} broke below {nearest_support} at {current_price}")
+                # Generate breakdown signal
+                signal = self._generate_breakout_signal(symbol, 'BREAKDOWN', current_price, nearest_support)
+                self._send_alert(signal)
                 
-                # Check for confirmation (multiple candles above/below level)
-                if alert_config['breakout_confirmed'] or alert_config['breakdown_confirmed']:
-                    confirmation = self._check_breakout_confirmation(symbol, alert_config)
-                    if confirmation:
-                        alert_config['status'] = 'CONFIRMED'
-                        alerts_to_remove.append(alert_id)
-                        
-            except Exception as e:
-                logger.error(f"Error checking alert {alert_id}: {e}")
+                logger.info(f"BREAKDOWN ALERT: {symbol} broke below {nearest_support} at {current_price}")
+        
+        # Check for confirmation (multiple candles above/below level)
+        if alert_config['breakout_confirmed'] or alert_config['breakdown_confirmed']:
+            if self._check_breakout_confirmation(symbol, alert_config):
+                alert_config['status'] = 'CONFIRMED'
+                return True
         
-        # Remove confirmed alerts
-        for alert_id in alerts_to_remove:
-            self.alert_history.append(self.active_alerts[alert_id])
-            del self.active_alerts[alert_id]
+        return False
+    
+    def _snapshot(self):
+        """(alert_id, alert_config) pairs of the active alerts, safe to iterate without the lock"""
+        with self._lock:
+            return list(self.active_alerts.items())
+    
+    def _archive_alerts(self, alert_ids):
+        """Move finished alerts from the active set to the history"""
+        with self._lock:
+            for alert_id in alert_ids:
+                alert_config = self.active_alerts.pop(alert_id, None)
+                if alert_config is not None:
+                    self.alert_history.append(alert_config)
     
     def _check_breakout_confirmation(self, symbol: str, alert_config: Dict) -> bool:
         """Check if breakout/breakdown is confirmed by multiple candles"""
@@ -176,7 +196,7 @@ class AlertSystem:
                 'risk_amount': risk_amount,
                 'level_broken': level,
                 'current_price': current_price,
-                'oi_analysis': oi_analysis.get('oi_analysis', {}) if oi_analysis else {},
+                'oi_analysis': oi_analysis['oi_analysis'].to_dict() if oi_analysis else {},
                 'confidence': 'HIGH' if oi_analysis else 'MEDIUM',
                 'timestamp': datetime.now(),
                 'alert_message': self._format_alert_message(symbol, signal_type, action, entry_price, stop_loss, take_profit)
@@ -248,46 +268,55 @@ Risk-Reward: {abs(tp - entry) / abs(entry - sl):.1f}:1
             'status': 'ACTIVE'
         }
         
-        self.active_alerts[alert_id] = alert_config
+        with self._lock:
+            self.active_alerts[alert_id] = alert_config
         return alert_id
     
     def check_pcr_alerts(self):
         """Check PCR-based alerts"""
-        for alert_id, alert_config in self.active_alerts.items():
+        for alert_id, alert_config in self._snapshot():
             if alert_config.get('alert_type') != 'PCR':
                 continue
                 
             try:
-                symbol = alert_config['symbol']
-                pcr_data = self.data_fetcher.calculate_pcr(symbol)
-                
-                if pcr_data and pcr_data.get('pcr', 0) > alert_config['pcr_threshold']:
-                    message = f"PCR ALERT: {symbol} PCR is {pcr_data['pcr']:.2f} (above {alert_config['pcr_threshold']})"
-                    logger.info(message)
-                    print(f"🚨 {message}")
-                    
-                    # Mark alert as triggered
-                    alert_config['status'] = 'TRIGGERED'
+                self._check_pcr_alert(alert_config)
                     
             except Exception as e:
                 logger.error(f"Error checking PCR alert {alert_id}: {e}")
     
+    def _check_pcr_alert(self, alert_config: Dict):
+        """Check one PCR alert against the current PCR"""
+        symbol = alert_config['symbol']
+        pcr_data = self.data_fetcher.calculate_pcr(symbol)
+        
+        if pcr_data and pcr_data.get('pcr', 0) > alert_config['pcr_threshold']:
+            message = f"PCR ALERT: {symbol} PCR is {pcr_data['pcr']:.2f} (above {alert_config['pcr_threshold']})"
+            logger.info(message)
+            print(f"🚨 {message}")
+            
+            # Mark alert as triggered
+            alert_config['status'] = 'TRIGGERED'
+    
     def get_active_alerts(self) -> Dict:
-        """Get all active alerts"""
-        return self.active_alerts
+        """Get a snapshot of all active alerts (safe to iterate while checks run)"""
+        with self._lock:
+            return dict(self.active_alerts)
     
-    def get_alert_history(self) -> List[Dict]:
-        """Get alert history"""
-        return self.alert_history
+    def get_alert_history(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get alert history (only the most recent `limit` entries if given)"""
+        if limit is None:
+            return self.alert_history
+        return self.alert_history[-limit:] if limit > 0 else []
     
     def cancel_alert(self, alert_id: str) -> bool:
         """Cancel an active alert"""
-        if alert_id in self.active_alerts:
-            self.active_alerts[alert_id]['status'] = 'CANCELLED'
-            self.alert_history.append(self.active_alerts[alert_id])
-            del self.active_alerts[alert_id]
+        with self._lock:
+            alert_config = self.active_alerts.pop(alert_id, None)
+            if alert_config is None:
+                return False
+            alert_config['status'] = 'CANCELLED'
+            self.alert_history.append(alert_config)
             return True
-        return False
     
     def start_monitoring(self):
         """Start the alert monitoring system"""
@@ -320,32 +349,71 @@ Risk-Reward: {abs(tp - entry) / abs(entry - sl):.1f}:1
             'status': 'ACTIVE'
         }
         
-        self.active_alerts[alert_id] = alert_config
+        with self._lock:
+            self.active_alerts[alert_id] = alert_config
         return alert_id
     
     def check_volume_alerts(self):
         """Check volume-based alerts"""
-        for alert_id, alert_config in self.active_alerts.items():
+        for alert_id, alert_config in self._snapshot():
             if alert_config.get('alert_type') != 'VOLUME':
                 continue
                 
             try:
-                symbol = alert_config['symbol']
-                live_data = self.data_fetcher.get_live_price(symbol)
+                live_data = self.data_fetcher.get_live_price(alert_config['symbol'])
                 
                 if live_data:
-                    # Get historical volume data for comparison
-                    hist_data = self.data_fetcher.get_historical_data(symbol, period="5d")
-                    if hist_data is not None and len(hist_data) > 0:
-                        avg_volume = hist_data['Volume'].mean()
-                        current_volume = live_data['volume']
-                        
-                        if current_volume > avg_volume * alert_config['volume_threshold']:
-                            message = f"VOLUME ALERT: {symbol} volume is {current_volume:,.0f} ({(current_volume/avg_volume):.1f}x average)"
-                            logger.info(message)
-                            print(f"📊 {message}")
-                            
-                            alert_config['status'] = 'TRIGGERED'
+                    self._check_volume_alert(alert_config, live_data['volume'])
                             
             except Exception as e:
                 logger.error(f"Error checking volume alert {alert_id}: {e}")
+    
+    def _check_volume_alert(self, alert_config: Dict, current_volume: float):
+        """Check one volume alert against the current day volume"""
+        symbol = alert_config['symbol']
+        
+        # Get historical volume data for comparison
+        hist_data = self.data_fetcher.get_historical_data(symbol, period="5d")
+        if hist_data is not None and len(hist_data) > 0:
+            avg_volume = hist_data['Volume'].mean()
+            
+            if current_volume > avg_volume * alert_config['volume_threshold']:
+                message = f"VOLUME ALERT: {symbol} volume is {current_volume:,.0f} ({(current_volume/avg_volume):.1f}x average)"
+                logger.info(message)
+                print(f"📊 {message}")
+                
+                alert_config['status'] = 'TRIGGERED'
+    
+    def check_all_alerts(self):
+        """Check breakout, PCR and volume alerts in one pass
+        
+        Prices for every symbol with a breakout or volume alert are fetched in
+        a single batch download instead of one request per alert and check type.
+        """
+        # Network fetches run without the lock; it is only re-taken to archive
+        alerts = self._snapshot()
+        # PCR checks do not use the live price, so only fetch for the others
+        prices = self.data_fetcher.get_live_prices(
+            alert_config['symbol'] for _, alert_config in alerts
+            if alert_config.get('alert_type') != 'PCR'
+        )
+        alerts_to_remove = []
+        
+        for alert_id, alert_config in alerts:
+            alert_type = alert_config.get('alert_type')
+            live_data = prices.get(alert_config['symbol'])
+            
+            try:
+                if alert_type == 'PCR':
+                    self._check_pcr_alert(alert_config)
+                elif alert_type == 'VOLUME':
+                    if live_data:
+                        self._check_volume_alert(alert_config, live_data['volume'])
+                elif alert_config['status'] == 'ACTIVE' and live_data:
+                    if self._check_breakout_alert(alert_config, live_data['price']):
+                        alerts_to_remove.append(alert_id)
+                        
+            except Exception as e:
+                logger.error(f"Error checking alert {alert_id}: {e}")
+        
+        self._archive_alerts(alerts_to_remove)
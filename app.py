@@ -12,13 +12,12 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the trading agent
-from trading_agent import IndianStockTradingAgent
+from trading_agent import get_agent
 
 def main():
     """Main function for Streamlit app"""
-    # Create and run the trading agent
-    agent = IndianStockTradingAgent()
-    agent.run_streamlit_app()
+    # Run the trading agent (one cached instance shared across reruns)
+    get_agent().run_streamlit_app()
 
 if __name__ == "__main__":
     main()
@@ -241,6 +241,23 @@ class Config:
     PRE_MARKET_OPEN = "09:00"
     POST_MARKET_CLOSE = "15:45"
     
+    # HTTP Cache Settings (on-disk cache of Yahoo Finance chart responses,
+    # requires the optional requests-cache package)
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'false').lower() == 'true'
+    HTTP_CACHE_FILE = os.getenv('HTTP_CACHE_FILE', 'yfinance_cache.sqlite')
+    HTTP_CACHE_TTL = int(os.getenv('HTTP_CACHE_TTL', 3600))  # seconds
+    
+    # In-process cache of fetched prices/history shared by all fetchers (0 disables)
+    DATA_CACHE_TTL = int(os.getenv('DATA_CACHE_TTL', 30))  # seconds
+    LIVE_PRICE_CACHE_TTL = int(os.getenv('LIVE_PRICE_CACHE_TTL', 5))  # seconds, live quotes
+    DATA_CACHE_MAXSIZE = int(os.getenv('DATA_CACHE_MAXSIZE', 1024))
+    
+    # Warm up DNS/TLS to Yahoo Finance in the background at import time
+    NETWORK_WARMUP = os.getenv('STOCKAI_WARMUP', '0').lower() in ('1', 'true')
+    
+    # Dashboard: render metric rows as one HTML block (false = native st.metric widgets)
+    HTML_METRIC_CARDS = os.getenv('HTML_METRIC_CARDS', 'true').lower() == 'true'
+    
     # Database Settings
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///stock_agent.db')
     
@@ -1,24 +1,130 @@
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import requests
 from datetime import datetime, timedelta
 import time
+import socket
+import threading
+import functools
 import logging
 from config import Config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class IndianMarketDataFetcher:
-    def __init__(self):
-        self.config = Config()
-        self.session = requests.Session()
+def _create_cached_session():
+    """Create the on-disk HTTP cache session if enabled in the config"""
+    if not Config.HTTP_CACHE_ENABLED:
+        return None
+    
+    try:
+        from requests_cache import CachedSession, DO_NOT_CACHE
+    except ImportError:
+        logger.warning("HTTP_CACHE_ENABLED is set but requests-cache is not installed")
+        return None
+    
+    # Only historical chart data is invariant enough to persist; quotes,
+    # options chains and auth endpoints always go to the network
+    return CachedSession(
+        Config.HTTP_CACHE_FILE,
+        backend='sqlite',
+        allowable_methods=['GET'],
+        urls_expire_after={
+            '*/v8/finance/chart/*': Config.HTTP_CACHE_TTL,
+            '*': DO_NOT_CACHE
+        }
+    )
+
+_SESSION = _create_cached_session()
+
+def _ticker(symbol):
+    """Create a yfinance Ticker, routed through the HTTP cache when enabled"""
+    if _SESSION is not None:
+        return yf.Ticker(symbol, session=_SESSION)
+    return yf.Ticker(symbol)
+
+def _warmup():
+    """Resolve Yahoo Finance hosts and open a connection ahead of the first request"""
+    try:
+        socket.getaddrinfo('query1.finance.yahoo.com', 443)
+        socket.getaddrinfo('query2.finance.yahoo.com', 443)
+        # A tiny history request primes yfinance's own session (TLS + cookie/crumb)
+        _ticker(Config.MAJOR_INDICES['NIFTY50']).history(period="1d")
+    except Exception as e:
+        logger.debug(f"Network warmup failed: {e}")
+
+if Config.NETWORK_WARMUP:
+    threading.Thread(target=_warmup, name="yfinance-warmup", daemon=True).start()
+
+def _ttl_cache(func=None, *, ttl_setting='DATA_CACHE_TTL'):
+    """Cache a fetcher method's raw result process-wide for Config.<ttl_setting> seconds
+    
+    The key is the call arguments only (not the instance), so every fetcher
+    shares results. Failed fetches (None) are not cached.
+    """
+    if func is None:
+        return functools.partial(_ttl_cache, ttl_setting=ttl_setting)
+    
+    cache = {}
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        ttl = getattr(Config, ttl_setting)
+        if ttl <= 0:
+            return func(self, *args, **kwargs)
         
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        result = func(self, *args, **kwargs)
+        if result is not None:
+            with lock:
+                if len(cache) >= Config.DATA_CACHE_MAXSIZE:
+                    # Drop expired entries, then the oldest if still full
+                    for stale in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+                        del cache[stale]
+                    if len(cache) >= Config.DATA_CACHE_MAXSIZE:
+                        del cache[next(iter(cache))]
+                cache[key] = (now, result)
+        return result
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+# Sentiment label indexed by score + 1 (scores range from -1 to 5)
+_SENTIMENT_BY_SCORE = ('BEARISH',) + ('NEUTRAL',) * 3 + ('BULLISH',) * 3
+
+def _build_sentiment_table():
+    """Precompute (score, sentiment) for every combination of the 6 feature bits
+    
+    Bits, from most to least significant: price > SMA20, price > SMA50,
+    SMA20 > SMA50, RSI oversold, RSI overbought, high volume.
+    """
+    table = []
+    for key in range(64):
+        above_sma_20, above_sma_50, sma_cross, oversold, overbought, high_volume = (
+            (key >> shift) & 1 for shift in range(5, -1, -1)
+        )
+        score = above_sma_20 + above_sma_50 + sma_cross + oversold - overbought + high_volume
+        table.append((score, _SENTIMENT_BY_SCORE[score + 1]))
+    return tuple(table)
+
+_SENTIMENT_TABLE = _build_sentiment_table()
+
+class IndianMarketDataFetcher:
+    # No per-instance HTTP session: yfinance pools connections in its own
+    # process-wide session, and _ticker() routes through the shared cache
+    # session when enabled, so every fetcher reuses the same connections
+    
+    @_ttl_cache(ttl_setting='LIVE_PRICE_CACHE_TTL')
     def get_live_price(self, symbol):
         """Get live price for Indian stocks/indices"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _ticker(symbol)
             info = ticker.info
             return {
                 'symbol': symbol,
@@ -35,10 +141,59 @@ class IndianMarketDataFetcher:
             logger.error(f"Error fetching live price for {symbol}: {e}")
             return None
     
+    def get_live_prices(self, symbols):
+        """Get latest price and day volume for several symbols in one download
+        
+        Returns {symbol: {'symbol', 'price', 'volume', 'timestamp'}}; symbols
+        missing from the batch are fetched individually with get_live_price.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        prices = {}
+        if not symbols:
+            return prices
+        
+        try:
+            data = yf.download(
+                symbols, period="1d", interval="1m",
+                group_by='ticker', threads=True, progress=False
+            )
+        except Exception as e:
+            logger.error(f"Error fetching batch prices for {symbols}: {e}")
+            data = None
+        
+        if data is not None and not data.empty:
+            multi = isinstance(data.columns, pd.MultiIndex)
+            batch_symbols = set(data.columns.get_level_values(0)) if multi else set(symbols)
+            for symbol in symbols:
+                if symbol not in batch_symbols:
+                    continue
+                try:
+                    frame = data[symbol] if multi else data
+                    close = frame['Close'].dropna()
+                    if close.empty:
+                        continue
+                    prices[symbol] = {
+                        'symbol': symbol,
+                        'price': float(close.iloc[-1]),
+                        'volume': float(frame['Volume'].sum()),
+                        'timestamp': datetime.now()
+                    }
+                except Exception as e:
+                    logger.error(f"Error reading batch price for {symbol}: {e}")
+        
+        for symbol in symbols:
+            if symbol not in prices:
+                live_data = self.get_live_price(symbol)
+                if live_data:
+                    prices[symbol] = live_data
+        
+        return prices
+    
+    @_ttl_cache
     def get_historical_data(self, symbol, period="1mo", interval="1d"):
         """Get historical data for technical analysis"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _ticker(symbol)
             data = ticker.history(period=period, interval=interval)
             return data
         except Exception as e:
@@ -48,7 +203,7 @@ class IndianMarketDataFetcher:
     def get_intraday_data(self, symbol, interval="5m"):
         """Get intraday data for short-term analysis"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _ticker(symbol)
             data = ticker.history(period="5d", interval=interval)
             return data
         except Exception as e:
@@ -60,7 +215,7 @@ class IndianMarketDataFetcher:
         try:
             # This is a simplified PCR calculation
             # In real implementation, you'd need options data from NSE
-            ticker = yf.Ticker(symbol)
+            ticker = _ticker(symbol)
             
             # Get options chain (if available)
             try:
@@ -116,46 +271,33 @@ class IndianMarketDataFetcher:
             if data is None or len(data) < 20:
                 return None
             
-            # Calculate technical indicators
-            data['SMA_20'] = data['Close'].rolling(window=20).mean()
-            data['SMA_50'] = data['Close'].rolling(window=50).mean()
-            data['RSI'] = self.calculate_rsi(data['Close'])
-            data['Volume_MA'] = data['Volume'].rolling(window=20).mean()
-            
-            current_price = data['Close'].iloc[-1]
-            sma_20 = data['SMA_20'].iloc[-1]
-            sma_50 = data['SMA_50'].iloc[-1]
-            rsi = data['RSI'].iloc[-1]
-            volume_ratio = data['Volume'].iloc[-1] / data['Volume_MA'].iloc[-1]
+            # Calculate technical indicators on the raw arrays; only the
+            # latest value of each indicator is needed
+            close = data['Close'].to_numpy(dtype=np.float64)
+            volume = data['Volume'].to_numpy(dtype=np.float64)
             
-            # Sentiment scoring
-            sentiment_score = 0
+            current_price = float(close[-1])
+            sma_20 = float(close[-20:].mean())
+            sma_50 = float(close[-50:].mean()) if len(close) >= 50 else np.nan
+            rsi = float(self.calculate_rsi(data['Close']).to_numpy()[-1])
+            # A zero (or missing) 20-day volume average gives no ratio to
+            # compare against; treat it as ordinary volume
+            avg_volume = volume[-20:].mean()
+            volume_ratio = float(volume[-1] / avg_volume) if avg_volume > 0 else 1.0
+            if not np.isfinite(volume_ratio):
+                volume_ratio = 1.0
             
-            # Price vs moving averages
-            if current_price > sma_20:
-                sentiment_score += 1
-            if current_price > sma_50:
-                sentiment_score += 1
-            if sma_20 > sma_50:
-                sentiment_score += 1
-            
-            # RSI analysis
-            if rsi < 30:
-                sentiment_score += 1  # Oversold
-            elif rsi > 70:
-                sentiment_score -= 1  # Overbought
-            
-            # Volume analysis
-            if volume_ratio > 1.5:
-                sentiment_score += 1  # High volume
-            
-            # Determine sentiment
-            if sentiment_score >= 3:
-                sentiment = "BULLISH"
-            elif sentiment_score <= -1:
-                sentiment = "BEARISH"
-            else:
-                sentiment = "NEUTRAL"
+            # Sentiment scoring: pack the indicator conditions into a 6-bit key
+            # and look up the precomputed score and label
+            key = (
+                (current_price > sma_20) << 5
+                | (current_price > sma_50) << 4
+                | (sma_20 > sma_50) << 3
+                | (rsi < 30) << 2
+                | (rsi > 70) << 1
+                | (volume_ratio > 1.5)
+            )
+            sentiment_score, sentiment = _SENTIMENT_TABLE[key]
             
             return {
                 'symbol': symbol,
@@ -254,7 +396,7 @@ class IndianMarketDataFetcher:
         """Get overview of major Indian indices"""
         overview = {}
         
-        for name, symbol in self.config.MAJOR_INDICES.items():
+        for name, symbol in Config.MAJOR_INDICES.items():
             try:
                 data = self.get_live_price(symbol)
                 if data:
@@ -4,11 +4,14 @@ Installation Script for Indian Stock Market AI Agent
 Automatically sets up the environment and dependencies
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+REQUIRED_PACKAGES = ('yfinance', 'pandas', 'numpy', 'streamlit', 'plotly', 'requests')
+
 def run_command(command, description):
     """Run a command and handle errors"""
     print(f"🔄 {description}...")
@@ -25,8 +28,8 @@ def check_python_version():
     """Check if Python version is compatible"""
     print("🐍 Checking Python version...")
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print(f"❌ Python 3.8+ required. Current version: {version.major}.{version.minor}")
+    if version.major < 3 or (version.major == 3 and version.minor < 10):
+        print(f"❌ Python 3.10+ required. Current version: {version.major}.{version.minor}")
         return False
     print(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
     return True
@@ -71,29 +74,33 @@ def test_installation():
     """Test if installation was successful"""
     print("\n🧪 Testing installation...")
     
-    try:
-        # Test imports
-        import yfinance
-        import pandas
-        import numpy
-        import streamlit
-        import plotly
-        import requests
-        
-        print("✅ All required packages imported successfully")
-        
-        # Test basic functionality
-        from data_fetcher import IndianMarketDataFetcher
-        from oi_analyzer import OIAnalyzer
-        from alert_system import AlertSystem
-        
-        print("✅ All modules imported successfully")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import test failed: {e}")
+    # Check that required packages are present without importing them
+    missing = [
+        module for module in REQUIRED_PACKAGES
+        if importlib.util.find_spec(module) is None
+    ]
+    if missing:
+        print(f"❌ Import test failed: missing packages: {', '.join(missing)}")
         return False
+    
+    print("✅ All required packages found")
+    
+    # Import project modules in a child process so the installer itself
+    # doesn't keep pandas/yfinance/streamlit loaded
+    result = subprocess.run(
+        [sys.executable, "-c", "import data_fetcher, oi_analyzer, alert_system"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        print(f"❌ Import test failed: {error}")
+        return False
+    
+    print("✅ All modules imported successfully")
+    
+    return True
 
 def show_next_steps():
     """Show next steps for the user"""
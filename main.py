@@ -10,24 +10,31 @@ Usage:
     python main.py --alerts       # Start alert monitoring
 """
 
-import argparse
 import sys
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import threading
 from datetime import datetime
-from data_fetcher import IndianMarketDataFetcher
-from oi_analyzer import OIAnalyzer
-from alert_system import AlertSystem
-from trading_agent import IndianStockTradingAgent
-from config import Config
 
-# Setup logging
+# Setup logging: log calls only enqueue records, the file/console writes
+# happen on the listener's background thread
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = (logging.FileHandler('stock_agent.log'), logging.StreamHandler(sys.stdout))
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('stock_agent.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -73,11 +80,17 @@ def run_cli_interface():
     print("🇮🇳 Indian Stock Market AI Agent - CLI Mode")
     print("=" * 50)
     
-    config = Config()
+    from data_fetcher import IndianMarketDataFetcher
+    from oi_analyzer import OIAnalyzer
+    from alert_system import AlertSystem
+    
     data_fetcher = IndianMarketDataFetcher()
     oi_analyzer = OIAnalyzer()
     alert_system = AlertSystem()
     
+    # Pre-warm the shared price cache while the menu is shown
+    threading.Thread(target=data_fetcher.get_market_overview, name="overview-prewarm", daemon=True).start()
+    
     while True:
         print("\n📊 Available Options:")
         print("1. Market Overview")
@@ -113,12 +126,14 @@ def show_market_overview(data_fetcher):
     overview = data_fetcher.get_market_overview()
     
     if overview:
-        for name, data in overview.items():
-            print(f"{name}:")
-            print(f"  Price: ₹{data['price']:,.2f}")
-            print(f"  Change: ₹{data['change']:,.2f} ({data['change_percent']:.2f}%)")
-            print(f"  Volume: {data['volume']:,.0f}")
-            print()
+        sys.stdout.write(''.join(
+            f"{name}:\n"
+            f"  Price: ₹{data['price']:,.2f}\n"
+            f"  Change: ₹{data['change']:,.2f} ({data['change_percent']:.2f}%)\n"
+            f"  Volume: {data['volume']:,.0f}\n"
+            f"\n"
+            for name, data in overview.items()
+        ))
     else:
         print("❌ Unable to fetch market data")
 
@@ -137,28 +152,31 @@ def run_oi_analysis(oi_analyzer):
     
     analysis = oi_analyzer.analyze_oi_data(symbol)
     
+    out = []
     if analysis:
-        print(f"\n✅ Analysis completed for {symbol}")
+        out.append(f"\n✅ Analysis completed for {symbol}")
         
-        oi_analysis = analysis.get('oi_analysis', {})
-        pcr_interpretation = oi_analysis.get('pcr_interpretation', {})
+        oi_analysis = analysis['oi_analysis']
+        pcr_interpretation = oi_analysis.pcr_interpretation
         
-        print(f"\n📊 PCR Analysis:")
-        print(f"  Signal: {pcr_interpretation.get('signal', 'NEUTRAL')}")
-        print(f"  Confidence: {pcr_interpretation.get('confidence', 'LOW')}")
-        print(f"  Action: {pcr_interpretation.get('action', 'Follow technicals')}")
+        out.append(f"\n📊 PCR Analysis:")
+        out.append(f"  Signal: {pcr_interpretation.signal}")
+        out.append(f"  Confidence: {pcr_interpretation.confidence}")
+        out.append(f"  Action: {pcr_interpretation.action}")
         
         signals = analysis.get('trading_signals', [])
         if signals:
-            print(f"\n🎯 Trading Signals ({len(signals)} found):")
+            out.append(f"\n🎯 Trading Signals ({len(signals)} found):")
             for i, signal in enumerate(signals, 1):
-                print(f"  {i}. {signal.get('type', 'UNKNOWN')}")
-                print(f"     Reason: {signal.get('reason', 'N/A')}")
-                print(f"     Confidence: {signal.get('confidence', 'N/A')}")
+                out.append(f"  {i}. {signal.type}")
+                out.append(f"     Reason: {signal.reason}")
+                out.append(f"     Confidence: {signal.confidence}")
         else:
-            print("\n⚠️ No trading signals generated")
+            out.append("\n⚠️ No trading signals generated")
     else:
-        print("❌ Unable to analyze symbol")
+        out.append("❌ Unable to analyze symbol")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def setup_alerts_cli(alert_system, data_fetcher):
     """Setup alerts in CLI"""
@@ -194,44 +212,36 @@ def setup_alerts_cli(alert_system, data_fetcher):
     except ValueError:
         print("❌ Invalid PCR threshold")
 
-def show_cheatsheet(oi_analyzer):
-    """Show master cheatsheet in CLI"""
-    print("\n📋 Master OI Trading Cheatsheet")
-    print("=" * 50)
-    
-    cheatsheet = oi_analyzer.get_oi_cheatsheet()
+@functools.lru_cache(maxsize=None)
+def _render_cheatsheet():
+    """Render the (constant) master cheatsheet once"""
+    from oi_analyzer import get_oi_cheatsheet
     
-    print("\n📊 PCR Interpretation:")
-    for pcr_range, action in cheatsheet['pcr_interpretation'].items():
-        print(f"  {pcr_range}: {action}")
+    cheatsheet = get_oi_cheatsheet()
+    rules = cheatsheet['trading_rules']
     
-    print("\n📈 OI Patterns:")
-    for pattern, description in cheatsheet['oi_patterns'].items():
-        print(f"  {pattern}: {description}")
-    
-    print("\n🎯 Trading Rules:")
-    print("  Buy Calls When:")
-    for rule in cheatsheet['trading_rules']['Buy Calls When']:
-        print(f"    • {rule}")
-    
-    print("  Buy Puts When:")
-    for rule in cheatsheet['trading_rules']['Buy Puts When']:
-        print(f"    • {rule}")
-    
-    print("  Avoid Trading When:")
-    for rule in cheatsheet['trading_rules']['Avoid Trading When']:
-        print(f"    • {rule}")
-    
-    print("\n🛡️ Risk Management:")
-    for rule, value in cheatsheet['risk_management'].items():
-        print(f"  {rule}: {value}")
+    return ''.join((
+        "\n📋 Master OI Trading Cheatsheet\n", "=" * 50, "\n",
+        "\n📊 PCR Interpretation:\n",
+        *(f"  {pcr_range}: {action}\n" for pcr_range, action in cheatsheet['pcr_interpretation'].items()),
+        "\n📈 OI Patterns:\n",
+        *(f"  {pattern}: {description}\n" for pattern, description in cheatsheet['oi_patterns'].items()),
+        "\n🎯 Trading Rules:\n",
+        *(f"  {heading}:\n" + ''.join(f"    • {rule}\n" for rule in rules[heading])
+          for heading in ('Buy Calls When', 'Buy Puts When', 'Avoid Trading When')),
+        "\n🛡️ Risk Management:\n",
+        *(f"  {rule}: {value}\n" for rule, value in cheatsheet['risk_management'].items())
+    ))
+
+def show_cheatsheet(oi_analyzer):
+    """Show master cheatsheet in CLI"""
+    sys.stdout.write(_render_cheatsheet())
 
 def start_live_monitoring(alert_system):
     """Start live monitoring in CLI"""
-    print("\n🚨 Live Monitoring")
-    print("-" * 30)
-    print("Starting live monitoring...")
-    print("Press Ctrl+C to stop")
+    out = ["\n🚨 Live Monitoring", "-" * 30, "Starting live monitoring...", "Press Ctrl+C to stop"]
+    sys.stdout.write('\n'.join(out) + '\n')
+    sys.stdout.flush()
     
     try:
         alert_system.start_monitoring()
@@ -243,37 +253,65 @@ def quick_analysis(symbol):
     print(f"🔍 Quick Analysis for {symbol}")
     print("-" * 40)
     
+    from data_fetcher import IndianMarketDataFetcher
+    from oi_analyzer import OIAnalyzer
+    
     data_fetcher = IndianMarketDataFetcher()
     oi_analyzer = OIAnalyzer()
     
+    out = []
+    
     # Get live data
     live_data = data_fetcher.get_live_price(symbol)
     if live_data:
-        print(f"Current Price: ₹{live_data['price']:,.2f}")
-        print(f"Change: ₹{live_data['change']:,.2f} ({live_data['change_percent']:.2f}%)")
-        print(f"Volume: {live_data['volume']:,.0f}")
+        out.append(f"Current Price: ₹{live_data['price']:,.2f}")
+        out.append(f"Change: ₹{live_data['change']:,.2f} ({live_data['change_percent']:.2f}%)")
+        out.append(f"Volume: {live_data['volume']:,.0f}")
     
     # Get OI analysis
     analysis = oi_analyzer.analyze_oi_data(symbol)
     if analysis:
-        oi_analysis = analysis.get('oi_analysis', {})
-        pcr_interpretation = oi_analysis.get('pcr_interpretation', {})
+        oi_analysis = analysis['oi_analysis']
+        pcr_interpretation = oi_analysis.pcr_interpretation
         
-        print(f"\nPCR Signal: {pcr_interpretation.get('signal', 'NEUTRAL')}")
-        print(f"Action: {pcr_interpretation.get('action', 'Follow technicals')}")
+        out.append(f"\nPCR Signal: {pcr_interpretation.signal}")
+        out.append(f"Action: {pcr_interpretation.action}")
         
         signals = analysis.get('trading_signals', [])
         if signals:
-            print(f"\nTrading Signals: {len(signals)} found")
+            out.append(f"\nTrading Signals: {len(signals)} found")
             for signal in signals:
-                print(f"  • {signal.get('type', 'UNKNOWN')}: {signal.get('reason', 'N/A')}")
+                out.append(f"  • {signal.type}: {signal.reason}")
         else:
-            print("\nNo trading signals")
+            out.append("\nNo trading signals")
     else:
-        print("❌ Unable to analyze symbol")
+        out.append("❌ Unable to analyze symbol")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
-def main():
-    """Main function"""
+def start_web():
+    """Start the web interface"""
+    print("🌐 Starting web interface...")
+    run_web_interface()
+
+def start_alerts():
+    """Start alert monitoring"""
+    print("🚨 Starting alert monitoring...")
+    from alert_system import AlertSystem
+    alert_system = AlertSystem()
+    start_live_monitoring(alert_system)
+
+# Single-flag commands dispatched without building the argparse parser
+COMMANDS = {
+    '--web': start_web,
+    '--cli': run_cli_interface,
+    '--alerts': start_alerts
+}
+
+def build_parser():
+    """Build the full command line parser (used for help and uncommon arguments)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Indian Stock Market AI Agent - Advanced OI Analysis & Trading Signals",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -310,19 +348,31 @@ Examples:
         help='Start alert monitoring'
     )
     
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main function"""
+    argv = sys.argv[1:]
+    
+    # Fast path for the common invocations
+    if len(argv) == 1 and argv[0] in COMMANDS:
+        COMMANDS[argv[0]]()
+        return
+    if len(argv) == 2 and argv[0] == '--analyze' and not argv[1].startswith('-'):
+        quick_analysis(argv[1])
+        return
+    
+    parser = build_parser()
+    args = parser.parse_args(argv)
     
     if args.web:
-        print("🌐 Starting web interface...")
-        run_web_interface()
+        start_web()
     elif args.cli:
         run_cli_interface()
     elif args.analyze:
         quick_analysis(args.analyze)
     elif args.alerts:
-        print("🚨 Starting alert monitoring...")
-        alert_system = AlertSystem()
-        start_live_monitoring(alert_system)
+        start_alerts()
     else:
         # Default: show help
         parser.print_help()
@@ -1,52 +1,501 @@
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 import logging
-from data_fetcher import IndianMarketDataFetcher
+import math
+import time
+import functools
+import threading
+import asyncio
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Timeout (seconds) for each data fetch in an analysis
+FETCH_TIMEOUT = 10
+
+# How long (seconds) analyze_oi_data results are reused for a symbol
+ANALYSIS_TTL = 30
+
+class _NoAnalysis(Exception):
+    """Raised through the analysis cache so failed analyses are not memoized"""
+
+# Shared pool for the network-bound data fetches, reused across analyzers
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="oi-fetch")
+
+# (monotonic time, datetime) of the last timestamp handed out
+_ts_cache = (float('-inf'), None)
+
+def _now_cached():
+    """Current datetime with one second resolution, reused between calls"""
+    global _ts_cache
+    t = time.monotonic()
+    if t - _ts_cache[0] > 1.0:
+        _ts_cache = (t, datetime.now())
+    return _ts_cache[1]
+
+@functools.lru_cache(maxsize=None)
+def _max_pain_kernel():
+    """Nearest-level search kernel, built on first use
+    
+    NumPy (and numba, when available) are only imported here so that
+    importing this module stays cheap. With numba the kernel is compiled
+    with an explicit signature and cached on disk; it releases the GIL so
+    batch scans on the fetch pool can run it in parallel.
+    """
+    import numpy as np
+    
+    try:
+        from numba import njit
+    except ImportError:
+        def find_max_pain(levels, price):
+            return int(np.abs(levels - price).argmin())
+        return find_max_pain
+    
+    @njit('int64(float64[::1], float64)', cache=True, nogil=True)
+    def find_max_pain(levels, price):
+        best = 0
+        best_distance = abs(levels[0] - price)
+        for i in range(1, levels.shape[0]):
+            distance = abs(levels[i] - price)
+            if distance < best_distance:
+                best = i
+                best_distance = distance
+        return best
+    
+    return find_max_pain
+
+# Master cheatsheet for OI analysis (shared, treat as read-only)
+_OI_CHEATSHEET = {
+    'pcr_interpretation': {
+        'PCR > 1.5': 'Extreme fear - Buy calls',
+        'PCR 1.2-1.5': 'Fear - Consider calls on dips',
+        'PCR 0.8-1.2': 'Neutral - Follow technicals',
+        'PCR 0.5-0.8': 'Greed - Consider puts',
+        'PCR < 0.5': 'Extreme greed - Buy puts'
+    },
+    'oi_patterns': {
+        'High PCR + Bearish Sentiment': 'PUT_BUILDUP - Potential reversal',
+        'Low PCR + Bullish Sentiment': 'CALL_BUILDUP - Potential reversal',
+        'PCR Spike': 'Unwinding signal - High volatility expected',
+        'PCR Drop': 'Covering signal - Trend continuation likely'
+    },
+    'trading_rules': {
+        'Buy Calls When': [
+            'PCR > 1.5 (extreme fear)',
+            'Heavy put buildup detected',
+            'Price near strong support',
+            'RSI oversold (< 30)'
+        ],
+        'Buy Puts When': [
+            'PCR < 0.5 (extreme greed)',
+            'Heavy call buildup detected',
+            'Price near strong resistance',
+            'RSI overbought (> 70)'
+        ],
+        'Avoid Trading When': [
+            'PCR between 0.8-1.2 (neutral)',
+            'Low volume',
+            'Major news events pending',
+            'Expiry week (high gamma)'
+        ]
+    },
+    'risk_management': {
+        'Position Sizing': '2% risk per trade',
+        'Stop Loss': '5% from entry',
+        'Take Profit': '15% from entry',
+        'Max Positions': '3 concurrent trades'
+    }
+}
+
+class _AnalysisResult:
+    """Base for analysis result records"""
+    __slots__ = ()
+    
+    def to_dict(self):
+        """Plain dict copy, for JSON/Streamlit serialization"""
+        return asdict(self)
+
+@dataclass(slots=True, frozen=True)
+class PCRInterpretation(_AnalysisResult):
+    signal: str
+    interpretation: str
+    confidence: str
+    action: str
+
+@dataclass(slots=True, frozen=True)
+class OIBuildup(_AnalysisResult):
+    pattern: str
+    interpretation: str
+    risk_level: str
+    timeframe: str
+
+@dataclass(slots=True, frozen=True)
+class MaxPainAnalysis(_AnalysisResult):
+    max_pain_level: float
+    distance_from_current: float
+    probability: str
+
+@dataclass(slots=True, frozen=True)
+class GammaExposure(_AnalysisResult):
+    exposure_level: str
+    risk_implication: str
+    hedging_needed: bool
+
+@dataclass(slots=True, frozen=True)
+class VolSkew(_AnalysisResult):
+    skew_type: str
+    interpretation: str
+    trading_implication: str
+
+@dataclass(slots=True, frozen=True)
+class UnwindingSignal(_AnalysisResult):
+    signal: str
+    interpretation: str
+    confidence: str
+
+@dataclass(slots=True, frozen=True)
+class RolloverAnalysis(_AnalysisResult):
+    pattern: str
+    interpretation: str
+    impact: str
+
+@dataclass(slots=True, frozen=True)
+class TradingSignal(_AnalysisResult):
+    type: str
+    reason: str
+    confidence: str
+    timeframe: str
+    risk_level: str
+
+@dataclass(slots=True, frozen=True)
+class OIAnalysis(_AnalysisResult):
+    pcr_interpretation: PCRInterpretation
+    oi_buildup: OIBuildup
+    max_pain_analysis: MaxPainAnalysis | None
+    gamma_exposure: GammaExposure
+    volatility_skew: VolSkew
+    unwinding_signals: UnwindingSignal
+    rollover_analysis: RolloverAnalysis
+
+# PCR interpretation, selected by comparing the PCR against ascending thresholds
+# (a PCR equal to a threshold falls into the lower bucket); a missing or
+# non-finite PCR is read as NEUTRAL
+_PCR_NON_FINITE_INDEX = 2
+_PCR_THRESHOLDS = (Config.PCR_THRESHOLD_LOW, 0.8, 1.2, Config.PCR_THRESHOLD_HIGH)
+_PCR_RESULTS = (
+    PCRInterpretation(
+        signal='EXTREME_GREED',
+        interpretation='High call buying indicates greed. Market may be overbought.',
+        confidence='HIGH',
+        action='Consider buying puts or selling calls'
+    ),
+    PCRInterpretation(
+        signal='GREED',
+        interpretation='Moderate call buying. Bullish sentiment.',
+        confidence='MEDIUM',
+        action='Consider buying puts or selling calls'
+    ),
+    PCRInterpretation(
+        signal='NEUTRAL',
+        interpretation='Balanced options activity.',
+        confidence='LOW',
+        action='Follow technical analysis'
+    ),
+    PCRInterpretation(
+        signal='FEAR',
+        interpretation='Moderate put buying. Bearish sentiment.',
+        confidence='MEDIUM',
+        action='Wait for confirmation or buy calls on dips'
+    ),
+    PCRInterpretation(
+        signal='EXTREME_FEAR',
+        interpretation='High put buying indicates fear. Market may be oversold.',
+        confidence='HIGH',
+        action='Consider buying calls or covering shorts'
+    )
+)
+
+# Gamma exposure, selected the same way as the PCR interpretation
+_GAMMA_THRESHOLDS = (0.8, 1.2)
+_GAMMA_RESULTS = (
+    GammaExposure(
+        exposure_level='LOW',
+        risk_implication='Normal volatility',
+        hedging_needed=False
+    ),
+    GammaExposure(
+        exposure_level='MEDIUM',
+        risk_implication='Normal volatility',
+        hedging_needed=False
+    ),
+    GammaExposure(
+        exposure_level='HIGH',
+        risk_implication='High volatility expected',
+        hedging_needed=True
+    )
+)
+
+# Volatility skew, indexed by the number of thresholds (>= 0.8, > 1.2) the PCR
+# passes; a missing (NaN) PCR is NORMAL, as with the original if-chain
+_SKEW_NAN_INDEX = 1
+_SKEW_RESULTS = (
+    VolSkew(
+        skew_type='CALL_SKEW',
+        interpretation='Higher call premiums indicate greed',
+        trading_implication='Consider selling calls or buying puts'
+    ),
+    VolSkew(
+        skew_type='NORMAL',
+        interpretation='Balanced volatility skew',
+        trading_implication='Follow technical analysis'
+    ),
+    VolSkew(
+        skew_type='PUT_SKEW',
+        interpretation='Higher put premiums indicate fear',
+        trading_implication='Consider selling puts or buying calls'
+    )
+)
+
+def _compile_threshold_lookup(name, thresholds, results):
+    """Generate results[bisect_left(thresholds, value)] as a comparison chain
+    
+    The thresholds are baked into the generated code as constants, so each
+    lookup is a few inline float comparisons instead of a bisect call.
+    """
+    lines = [f"def {name}(value):"]
+    for i in range(len(thresholds) - 1, -1, -1):
+        lines.append(f"    if value > {float(thresholds[i])!r}: return results[{i + 1}]")
+    lines.append("    return results[0]")
+    namespace = {'results': tuple(results)}
+    exec(compile('\n'.join(lines), f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+_lookup_pcr = _compile_threshold_lookup('_lookup_pcr', _PCR_THRESHOLDS, _PCR_RESULTS)
+_lookup_gamma = _compile_threshold_lookup('_lookup_gamma', _GAMMA_THRESHOLDS, _GAMMA_RESULTS)
+
+# Trading signals keyed on the PCR interpretation signal. EXTREME_FEAR and
+# EXTREME_GREED are always interpreted with HIGH confidence.
+_PCR_SIGNAL_MAP = {
+    'EXTREME_FEAR': TradingSignal(
+        type='BUY_CALL',
+        reason='Extreme fear in market, potential reversal',
+        confidence='HIGH',
+        timeframe='SHORT_TERM',
+        risk_level='MEDIUM'
+    ),
+    'EXTREME_GREED': TradingSignal(
+        type='BUY_PUT',
+        reason='Extreme greed in market, potential reversal',
+        confidence='HIGH',
+        timeframe='SHORT_TERM',
+        risk_level='MEDIUM'
+    )
+}
+
+# Trading signals keyed on the detected OI buildup pattern
+_OI_BUILDUP_SIGNAL_MAP = {
+    'PUT_BUILDUP': TradingSignal(
+        type='BUY_CALL',
+        reason='Heavy put buildup, potential short squeeze',
+        confidence='HIGH',
+        timeframe='SHORT_TERM',
+        risk_level='HIGH'
+    ),
+    'CALL_BUILDUP': TradingSignal(
+        type='BUY_PUT',
+        reason='Heavy call buildup, potential reversal',
+        confidence='HIGH',
+        timeframe='SHORT_TERM',
+        risk_level='HIGH'
+    )
+}
+
+def get_oi_cheatsheet():
+    """Master cheatsheet for OI analysis (shared, treat as read-only)"""
+    return _OI_CHEATSHEET
+
+# Configuration is static, so a single instance is shared by all analyzers
+CONFIG = Config()
+
+_DEFAULT_FETCHER = None
+_DEFAULT_FETCHER_LOCK = threading.Lock()
+
+def _get_default_fetcher():
+    """Shared data fetcher, created on first use"""
+    global _DEFAULT_FETCHER
+    if _DEFAULT_FETCHER is None:
+        with _DEFAULT_FETCHER_LOCK:
+            if _DEFAULT_FETCHER is None:
+                from data_fetcher import IndianMarketDataFetcher
+                _DEFAULT_FETCHER = IndianMarketDataFetcher()
+    return _DEFAULT_FETCHER
+
 class OIAnalyzer:
-    def __init__(self):
-        self.config = Config()
-        self.data_fetcher = IndianMarketDataFetcher()
+    def __init__(self, data_fetcher=None):
+        self.config = CONFIG
+        self.data_fetcher = data_fetcher or _get_default_fetcher()
+        self._cached_analysis = functools.lru_cache(maxsize=256)(self._analyze_oi_data)
         
     def analyze_oi_data(self, symbol):
         """Comprehensive OI analysis for options trading"""
+        # Results are reused within the same ANALYSIS_TTL window; failures are
+        # not cached, so the next call retries the fetch
         try:
-            # Get PCR data
-            pcr_data = self.data_fetcher.calculate_pcr(symbol)
-            
-            # Get market sentiment
-            sentiment_data = self.data_fetcher.get_market_sentiment(symbol)
-            
-            # Get support/resistance levels
-            levels_data = self.data_fetcher.get_support_resistance_levels(symbol)
-            
-            # Get live price
-            live_data = self.data_fetcher.get_live_price(symbol)
+            return self._cached_analysis(symbol, int(time.time() // ANALYSIS_TTL))
+        except _NoAnalysis:
+            return None
+    
+    def _analyze_oi_data(self, symbol, time_bucket):
+        """Uncached OI analysis; time_bucket only serves as part of the cache key"""
+        try:
+            # Fetch PCR, sentiment, support/resistance and live price concurrently
+            futures = [
+                _EXECUTOR.submit(fetch, symbol)
+                for fetch in self._input_fetchers()
+            ]
+            inputs = [self._future_result(future, symbol) for future in futures]
             
-            if not all([pcr_data, sentiment_data, levels_data, live_data]):
-                return None
+            result = self._build_analysis(symbol, *inputs)
             
-            # Analyze OI patterns
-            oi_analysis = self._analyze_oi_patterns(pcr_data, sentiment_data, levels_data, live_data)
+        except Exception as e:
+            logger.error(f"Error in OI analysis for {symbol}: {e}")
+            result = None
+        
+        if result is None:
+            raise _NoAnalysis(symbol)
+        return result
+    
+    async def analyze_oi_data_async(self, symbol):
+        """Comprehensive OI analysis for options trading (asyncio version)"""
+        try:
+            # yfinance is blocking, so the fetches run on the shared pool and
+            # are awaited together
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(loop.run_in_executor(_EXECUTOR, fetch, symbol), FETCH_TIMEOUT)
+                    for fetch in self._input_fetchers()
+                ),
+                return_exceptions=True
+            )
             
-            # Generate trading signals
-            signals = self._generate_trading_signals(oi_analysis)
+            inputs = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"Error fetching OI input data for {symbol}: {result}")
+                    result = None
+                inputs.append(result)
             
-            return {
-                'symbol': symbol,
-                'oi_analysis': oi_analysis,
-                'trading_signals': signals,
-                'timestamp': datetime.now()
-            }
+            return self._build_analysis(symbol, *inputs)
             
         except Exception as e:
             logger.error(f"Error in OI analysis for {symbol}: {e}")
             return None
     
+    async def analyze_many(self, symbols):
+        """Run OI analysis for several symbols concurrently"""
+        results = await asyncio.gather(
+            *(self.analyze_oi_data_async(symbol) for symbol in symbols)
+        )
+        return dict(zip(symbols, results))
+    
+    def analyze_batch(self, symbols):
+        """Scan several symbols into one DataFrame (one row per symbol)
+        
+        PCR, gamma and skew classification run as vectorized lookups over the
+        whole batch instead of per-symbol branching.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        fetchers = (
+            self.data_fetcher.calculate_pcr,
+            self.data_fetcher.get_market_sentiment,
+            self.data_fetcher.get_live_price
+        )
+        futures = [
+            [_EXECUTOR.submit(fetch, symbol) for fetch in fetchers]
+            for symbol in symbols
+        ]
+        
+        # Fetch into columns, skipping symbols with incomplete data
+        names, pcrs, rsis, sentiments, prices = [], [], [], [], []
+        for symbol, symbol_futures in zip(symbols, futures):
+            pcr_data, sentiment_data, live_data = (
+                self._future_result(future, symbol) for future in symbol_futures
+            )
+            if not (pcr_data and sentiment_data and live_data):
+                continue
+            names.append(symbol)
+            pcrs.append(pcr_data.get('pcr', 1.0))
+            rsis.append(sentiment_data.get('rsi', 50))
+            sentiments.append(sentiment_data.get('sentiment', 'NEUTRAL'))
+            prices.append(live_data['price'])
+        
+        pcrs = np.asarray(pcrs, dtype=np.float64)
+        # searchsorted(side='left') matches the per-symbol threshold lookups for
+        # finite values; it sorts NaN last, so NaN/inf get the scalar results
+        # explicitly (NEUTRAL PCR, LOW gamma, NORMAL skew for NaN)
+        nan = np.isnan(pcrs)
+        pcr_idx = np.where(
+            np.isfinite(pcrs), np.searchsorted(_PCR_THRESHOLDS, pcrs, side='left'), _PCR_NON_FINITE_INDEX
+        )
+        gamma_idx = np.where(nan, 0, np.searchsorted(_GAMMA_THRESHOLDS, pcrs, side='left'))
+        skew_idx = np.where(nan, _SKEW_NAN_INDEX, (pcrs >= 0.8).astype(np.intp) + (pcrs > 1.2))
+        
+        def column(results, field, idx):
+            return np.array([getattr(result, field) for result in results])[idx]
+        
+        return pd.DataFrame({
+            'symbol': names,
+            'price': np.asarray(prices, dtype=np.float64),
+            'pcr': pcrs,
+            'rsi': np.asarray(rsis, dtype=np.float64),
+            'sentiment': sentiments,
+            'pcr_signal': column(_PCR_RESULTS, 'signal', pcr_idx),
+            'confidence': column(_PCR_RESULTS, 'confidence', pcr_idx),
+            'action': column(_PCR_RESULTS, 'action', pcr_idx),
+            'gamma_exposure': column(_GAMMA_RESULTS, 'exposure_level', gamma_idx),
+            'hedging_needed': column(_GAMMA_RESULTS, 'hedging_needed', gamma_idx),
+            'volatility_skew': column(_SKEW_RESULTS, 'skew_type', skew_idx)
+        })
+    
+    def _input_fetchers(self):
+        """Data fetcher methods whose results feed an OI analysis"""
+        return (
+            self.data_fetcher.calculate_pcr,
+            self.data_fetcher.get_market_sentiment,
+            self.data_fetcher.get_support_resistance_levels,
+            self.data_fetcher.get_live_price
+        )
+    
+    def _build_analysis(self, symbol, pcr_data, sentiment_data, levels_data, live_data):
+        """Build the analysis result from the fetched input data"""
+        if not all([pcr_data, sentiment_data, levels_data, live_data]):
+            return None
+        
+        # Analyze OI patterns
+        oi_analysis = self._analyze_oi_patterns(pcr_data, sentiment_data, levels_data, live_data)
+        
+        # Generate trading signals
+        signals = self._generate_trading_signals(oi_analysis)
+        
+        return {
+            'symbol': symbol,
+            'oi_analysis': oi_analysis,
+            'trading_signals': signals,
+            'timestamp': _now_cached()
+        }
+    
+    def _future_result(self, future, symbol):
+        """Collect a fetch result, treating failures and timeouts as missing data"""
+        try:
+            return future.result(timeout=FETCH_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error fetching OI input data for {symbol}: {e}")
+            return None
+    
     def _analyze_oi_patterns(self, pcr_data, sentiment_data, levels_data, live_data):
         """Analyze OI patterns and market structure"""
         current_price = live_data['price']
@@ -55,79 +504,45 @@ class OIAnalyzer:
         rsi = sentiment_data.get('rsi', 50)
         
         # OI Analysis Rules
-        analysis = {
-            'pcr_interpretation': self._interpret_pcr(pcr),
-            'oi_buildup': self._detect_oi_buildup(pcr, sentiment),
-            'max_pain_analysis': self._calculate_max_pain(current_price, levels_data),
-            'gamma_exposure': self._estimate_gamma_exposure(pcr, current_price),
-            'volatility_skew': self._analyze_volatility_skew(pcr, sentiment),
-            'unwinding_signals': self._detect_unwinding_signals(pcr, sentiment),
-            'rollover_analysis': self._analyze_rollover_patterns(pcr, sentiment)
-        }
-        
-        return analysis
+        return OIAnalysis(
+            pcr_interpretation=self._interpret_pcr(pcr),
+            oi_buildup=self._detect_oi_buildup(pcr, sentiment),
+            max_pain_analysis=self._calculate_max_pain(current_price, levels_data),
+            gamma_exposure=self._estimate_gamma_exposure(pcr, current_price),
+            volatility_skew=self._analyze_volatility_skew(pcr, sentiment),
+            unwinding_signals=self._detect_unwinding_signals(pcr, sentiment),
+            rollover_analysis=self._analyze_rollover_patterns(pcr, sentiment)
+        )
     
     def _interpret_pcr(self, pcr):
         """Interpret Put-Call Ratio"""
-        if pcr > 1.5:
-            return {
-                'signal': 'EXTREME_FEAR',
-                'interpretation': 'High put buying indicates fear. Market may be oversold.',
-                'confidence': 'HIGH',
-                'action': 'Consider buying calls or covering shorts'
-            }
-        elif pcr > 1.2:
-            return {
-                'signal': 'FEAR',
-                'interpretation': 'Moderate put buying. Bearish sentiment.',
-                'confidence': 'MEDIUM',
-                'action': 'Wait for confirmation or buy calls on dips'
-            }
-        elif pcr > 0.8:
-            return {
-                'signal': 'NEUTRAL',
-                'interpretation': 'Balanced options activity.',
-                'confidence': 'LOW',
-                'action': 'Follow technical analysis'
-            }
-        elif pcr > 0.5:
-            return {
-                'signal': 'GREED',
-                'interpretation': 'Moderate call buying. Bullish sentiment.',
-                'confidence': 'MEDIUM',
-                'action': 'Consider buying puts or selling calls'
-            }
-        else:
-            return {
-                'signal': 'EXTREME_GREED',
-                'interpretation': 'High call buying indicates greed. Market may be overbought.',
-                'confidence': 'HIGH',
-                'action': 'Consider buying puts or selling calls'
-            }
+        if not math.isfinite(pcr):
+            return _PCR_RESULTS[_PCR_NON_FINITE_INDEX]
+        return _lookup_pcr(pcr)
     
     def _detect_oi_buildup(self, pcr, sentiment):
         """Detect OI buildup patterns"""
         if pcr > 1.2 and sentiment == 'BEARISH':
-            return {
-                'pattern': 'PUT_BUILDUP',
-                'interpretation': 'Heavy put writing/buying. Potential reversal signal.',
-                'risk_level': 'HIGH',
-                'timeframe': 'SHORT_TERM'
-            }
+            return OIBuildup(
+                pattern='PUT_BUILDUP',
+                interpretation='Heavy put writing/buying. Potential reversal signal.',
+                risk_level='HIGH',
+                timeframe='SHORT_TERM'
+            )
         elif pcr < 0.8 and sentiment == 'BULLISH':
-            return {
-                'pattern': 'CALL_BUILDUP',
-                'interpretation': 'Heavy call writing/buying. Potential reversal signal.',
-                'risk_level': 'HIGH',
-                'timeframe': 'SHORT_TERM'
-            }
+            return OIBuildup(
+                pattern='CALL_BUILDUP',
+                interpretation='Heavy call writing/buying. Potential reversal signal.',
+                risk_level='HIGH',
+                timeframe='SHORT_TERM'
+            )
         else:
-            return {
-                'pattern': 'BALANCED',
-                'interpretation': 'Normal OI distribution.',
-                'risk_level': 'LOW',
-                'timeframe': 'MEDIUM_TERM'
-            }
+            return OIBuildup(
+                pattern='BALANCED',
+                interpretation='Normal OI distribution.',
+                risk_level='LOW',
+                timeframe='MEDIUM_TERM'
+            )
     
     def _calculate_max_pain(self, current_price, levels_data):
         """Calculate max pain point (simplified)"""
@@ -138,184 +553,89 @@ class OIAnalyzer:
         resistance_levels = levels_data.get('resistance_levels', [])
         
         # Find the level with maximum options activity (simplified)
-        all_levels = support_levels + resistance_levels
-        if not all_levels:
+        import numpy as np
+        all_levels = np.asarray(support_levels + resistance_levels, dtype=np.float64)
+        if not all_levels.size:
             return None
         
         # Assume max pain is near current price
-        max_pain = min(all_levels, key=lambda x: abs(x - current_price))
+        max_pain = float(all_levels[_max_pain_kernel()(all_levels, float(current_price))])
         
-        return {
-            'max_pain_level': max_pain,
-            'distance_from_current': abs(current_price - max_pain),
-            'probability': 'MEDIUM' if abs(current_price - max_pain) / current_price < 0.02 else 'LOW'
-        }
+        return MaxPainAnalysis(
+            max_pain_level=max_pain,
+            distance_from_current=abs(current_price - max_pain),
+            probability='MEDIUM' if abs(current_price - max_pain) / current_price < 0.02 else 'LOW'
+        )
     
     def _estimate_gamma_exposure(self, pcr, current_price):
         """Estimate gamma exposure (simplified)"""
         # Higher PCR = more puts = higher gamma exposure
-        gamma_exposure = 'HIGH' if pcr > 1.2 else 'MEDIUM' if pcr > 0.8 else 'LOW'
-        
-        return {
-            'exposure_level': gamma_exposure,
-            'risk_implication': 'High volatility expected' if gamma_exposure == 'HIGH' else 'Normal volatility',
-            'hedging_needed': gamma_exposure == 'HIGH'
-        }
+        return _lookup_gamma(pcr)
     
     def _analyze_volatility_skew(self, pcr, sentiment):
         """Analyze volatility skew patterns"""
-        if pcr > 1.2:
-            skew = 'PUT_SKEW'
-            interpretation = 'Higher put premiums indicate fear'
-        elif pcr < 0.8:
-            skew = 'CALL_SKEW'
-            interpretation = 'Higher call premiums indicate greed'
-        else:
-            skew = 'NORMAL'
-            interpretation = 'Balanced volatility skew'
-        
-        return {
-            'skew_type': skew,
-            'interpretation': interpretation,
-            'trading_implication': self._get_skew_implication(skew)
-        }
-    
-    def _get_skew_implication(self, skew):
-        """Get trading implications from volatility skew"""
-        if skew == 'PUT_SKEW':
-            return 'Consider selling puts or buying calls'
-        elif skew == 'CALL_SKEW':
-            return 'Consider selling calls or buying puts'
-        else:
-            return 'Follow technical analysis'
+        # CALL_SKEW below 0.8, PUT_SKEW above 1.2, NORMAL in between (inclusive)
+        if math.isnan(pcr):
+            return _SKEW_RESULTS[_SKEW_NAN_INDEX]
+        return _SKEW_RESULTS[int(pcr >= 0.8) + int(pcr > 1.2)]
     
     def _detect_unwinding_signals(self, pcr, sentiment):
         """Detect options unwinding signals"""
         if pcr > 1.5 and sentiment == 'BULLISH':
-            return {
-                'signal': 'PUT_UNWINDING',
-                'interpretation': 'Put unwinding may lead to short covering rally',
-                'confidence': 'HIGH'
-            }
+            return UnwindingSignal(
+                signal='PUT_UNWINDING',
+                interpretation='Put unwinding may lead to short covering rally',
+                confidence='HIGH'
+            )
         elif pcr < 0.5 and sentiment == 'BEARISH':
-            return {
-                'signal': 'CALL_UNWINDING',
-                'interpretation': 'Call unwinding may lead to profit booking',
-                'confidence': 'HIGH'
-            }
+            return UnwindingSignal(
+                signal='CALL_UNWINDING',
+                interpretation='Call unwinding may lead to profit booking',
+                confidence='HIGH'
+            )
         else:
-            return {
-                'signal': 'NO_UNWINDING',
-                'interpretation': 'Normal options activity',
-                'confidence': 'LOW'
-            }
+            return UnwindingSignal(
+                signal='NO_UNWINDING',
+                interpretation='Normal options activity',
+                confidence='LOW'
+            )
     
     def _analyze_rollover_patterns(self, pcr, sentiment):
         """Analyze options rollover patterns"""
         # This would typically analyze expiry-wise OI changes
-        return {
-            'pattern': 'NORMAL_ROLLOVER',
-            'interpretation': 'Standard rollover activity',
-            'impact': 'MINIMAL'
-        }
+        return RolloverAnalysis(
+            pattern='NORMAL_ROLLOVER',
+            interpretation='Standard rollover activity',
+            impact='MINIMAL'
+        )
     
     def _generate_trading_signals(self, oi_analysis):
         """Generate trading signals based on OI analysis"""
         signals = []
         
-        pcr_interpretation = oi_analysis.get('pcr_interpretation', {})
-        oi_buildup = oi_analysis.get('oi_buildup', {})
-        max_pain = oi_analysis.get('max_pain_analysis', {})
+        max_pain = oi_analysis.max_pain_analysis
         
         # Signal 1: PCR-based signals
-        if pcr_interpretation.get('signal') == 'EXTREME_FEAR':
-            signals.append({
-                'type': 'BUY_CALL',
-                'reason': 'Extreme fear in market, potential reversal',
-                'confidence': pcr_interpretation.get('confidence', 'MEDIUM'),
-                'timeframe': 'SHORT_TERM',
-                'risk_level': 'MEDIUM'
-            })
-        elif pcr_interpretation.get('signal') == 'EXTREME_GREED':
-            signals.append({
-                'type': 'BUY_PUT',
-                'reason': 'Extreme greed in market, potential reversal',
-                'confidence': pcr_interpretation.get('confidence', 'MEDIUM'),
-                'timeframe': 'SHORT_TERM',
-                'risk_level': 'MEDIUM'
-            })
-        
         # Signal 2: OI buildup signals
-        if oi_buildup.get('pattern') == 'PUT_BUILDUP':
-            signals.append({
-                'type': 'BUY_CALL',
-                'reason': 'Heavy put buildup, potential short squeeze',
-                'confidence': 'HIGH',
-                'timeframe': 'SHORT_TERM',
-                'risk_level': 'HIGH'
-            })
-        elif oi_buildup.get('pattern') == 'CALL_BUILDUP':
-            signals.append({
-                'type': 'BUY_PUT',
-                'reason': 'Heavy call buildup, potential reversal',
-                'confidence': 'HIGH',
-                'timeframe': 'SHORT_TERM',
-                'risk_level': 'HIGH'
-            })
+        for signal_map, key in (
+            (_PCR_SIGNAL_MAP, oi_analysis.pcr_interpretation.signal),
+            (_OI_BUILDUP_SIGNAL_MAP, oi_analysis.oi_buildup.pattern)
+        ):
+            if (signal := signal_map.get(key)):
+                signals.append(signal)
         
         # Signal 3: Max pain signals
-        if max_pain and max_pain.get('probability') == 'HIGH':
-            max_pain_level = max_pain.get('max_pain_level', 0)
-            signals.append({
-                'type': 'MAX_PAIN_TRADE',
-                'reason': f'Price likely to gravitate towards {max_pain_level}',
-                'confidence': 'MEDIUM',
-                'timeframe': 'MEDIUM_TERM',
-                'risk_level': 'LOW'
-            })
+        if max_pain and max_pain.probability == 'HIGH':
+            signals.append(TradingSignal(
+                type='MAX_PAIN_TRADE',
+                reason=f'Price likely to gravitate towards {max_pain.max_pain_level}',
+                confidence='MEDIUM',
+                timeframe='MEDIUM_TERM',
+                risk_level='LOW'
+            ))
         
         return signals
     
     def get_oi_cheatsheet(self):
         """Master cheatsheet for OI analysis"""
-        return {
-            'pcr_interpretation': {
-                'PCR > 1.5': 'Extreme fear - Buy calls',
-                'PCR 1.2-1.5': 'Fear - Consider calls on dips',
-                'PCR 0.8-1.2': 'Neutral - Follow technicals',
-                'PCR 0.5-0.8': 'Greed - Consider puts',
-                'PCR < 0.5': 'Extreme greed - Buy puts'
-            },
-            'oi_patterns': {
-                'High PCR + Bearish Sentiment': 'PUT_BUILDUP - Potential reversal',
-                'Low PCR + Bullish Sentiment': 'CALL_BUILDUP - Potential reversal',
-                'PCR Spike': 'Unwinding signal - High volatility expected',
-                'PCR Drop': 'Covering signal - Trend continuation likely'
-            },
-            'trading_rules': {
-                'Buy Calls When': [
-                    'PCR > 1.5 (extreme fear)',
-                    'Heavy put buildup detected',
-                    'Price near strong support',
-                    'RSI oversold (< 30)'
-                ],
-                'Buy Puts When': [
-                    'PCR < 0.5 (extreme greed)',
-                    'Heavy call buildup detected',
-                    'Price near strong resistance',
-                    'RSI overbought (> 70)'
-                ],
-                'Avoid Trading When': [
-                    'PCR between 0.8-1.2 (neutral)',
-                    'Low volume',
-                    'Major news events pending',
-                    'Expiry week (high gamma)'
-                ]
-            },
-            'risk_management': {
-                'Position Sizing': '2% risk per trade',
-                'Stop Loss': '5% from entry',
-                'Take Profit': '15% from entry',
-                'Max Positions': '3 concurrent trades'
-            }
-        }
+        return get_oi_cheatsheet()
@@ -4,12 +4,16 @@ Quick Start Script for Indian Stock Market AI Agent
 Run this to test the system immediately!
 """
 
+import asyncio
+import io
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from data_fetcher import IndianMarketDataFetcher
 from oi_analyzer import OIAnalyzer
 from alert_system import AlertSystem
+from config import Config
 
 def print_banner():
     """Print welcome banner"""
@@ -20,82 +24,93 @@ def print_banner():
     print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
 
-def demo_market_overview():
+def demo_market_overview(out=None):
     """Demo market overview"""
-    print("📊 DEMO: Market Overview")
-    print("-" * 40)
+    print("📊 DEMO: Market Overview", file=out)
+    print("-" * 40, file=out)
     
     data_fetcher = IndianMarketDataFetcher()
     overview = data_fetcher.get_market_overview()
     
     if overview:
-        for name, data in overview.items():
-            print(f"{name:12} ₹{data['price']:8,.2f} {data['change_percent']:+6.2f}%")
+        print('\n'.join(
+            f"{name:12} ₹{data['price']:8,.2f} {data['change_percent']:+6.2f}%"
+            for name, data in overview.items()
+        ), file=out)
     else:
-        print("❌ Unable to fetch market data")
-    
-    print()
+        print("❌ Unable to fetch market data", file=out)
+    
+    # PCR signal for every index, analyzed concurrently
+    analyses = asyncio.run(OIAnalyzer(data_fetcher).analyze_many(list(Config.MAJOR_INDICES.values())))
+    print("\nPCR signals:", file=out)
+    print('\n'.join(
+        f"{name:12} {analyses[symbol]['oi_analysis'].pcr_interpretation.signal}"
+        if analyses[symbol] else f"{name:12} n/a"
+        for name, symbol in Config.MAJOR_INDICES.items()
+    ), file=out)
+    
+    print(file=out)
 
-def demo_oi_analysis():
+def demo_oi_analysis(out=None):
     """Demo OI analysis"""
-    print("🔍 DEMO: OI Analysis for NIFTY50")
-    print("-" * 40)
+    print("🔍 DEMO: OI Analysis for NIFTY50", file=out)
+    print("-" * 40, file=out)
     
     oi_analyzer = OIAnalyzer()
     analysis = oi_analyzer.analyze_oi_data("^NSEI")
     
     if analysis:
-        oi_analysis = analysis.get('oi_analysis', {})
-        pcr_interpretation = oi_analysis.get('pcr_interpretation', {})
+        oi_analysis = analysis['oi_analysis']
+        pcr_interpretation = oi_analysis.pcr_interpretation
         
-        print(f"PCR Signal:     {pcr_interpretation.get('signal', 'NEUTRAL')}")
-        print(f"Confidence:     {pcr_interpretation.get('confidence', 'LOW')}")
-        print(f"Action:         {pcr_interpretation.get('action', 'Follow technicals')}")
+        print(f"PCR Signal:     {pcr_interpretation.signal}", file=out)
+        print(f"Confidence:     {pcr_interpretation.confidence}", file=out)
+        print(f"Action:         {pcr_interpretation.action}", file=out)
         
         signals = analysis.get('trading_signals', [])
         if signals:
-            print(f"\nTrading Signals: {len(signals)} found")
+            print(f"\nTrading Signals: {len(signals)} found", file=out)
             for signal in signals:
-                print(f"  • {signal.get('type', 'UNKNOWN')}: {signal.get('reason', 'N/A')}")
+                print(f"  • {signal.type}: {signal.reason}", file=out)
         else:
-            print("\nNo trading signals generated")
+            print("\nNo trading signals generated", file=out)
     else:
-        print("❌ Unable to analyze NIFTY50")
+        print("❌ Unable to analyze NIFTY50", file=out)
     
-    print()
+    print(file=out)
 
-def demo_cheatsheet():
+def demo_cheatsheet(out=None):
     """Demo cheatsheet"""
-    print("📋 DEMO: Master Cheatsheet Preview")
-    print("-" * 40)
+    print("📋 DEMO: Master Cheatsheet Preview", file=out)
+    print("-" * 40, file=out)
     
     oi_analyzer = OIAnalyzer()
     cheatsheet = oi_analyzer.get_oi_cheatsheet()
     
-    print("PCR Interpretation:")
+    print("PCR Interpretation:", file=out)
     for pcr_range, action in list(cheatsheet['pcr_interpretation'].items())[:3]:
-        print(f"  {pcr_range}: {action}")
+        print(f"  {pcr_range}: {action}", file=out)
     
-    print("\nTrading Rules:")
-    print("  Buy Calls When:")
+    print("\nTrading Rules:", file=out)
+    print("  Buy Calls When:", file=out)
     for rule in cheatsheet['trading_rules']['Buy Calls When'][:2]:
-        print(f"    • {rule}")
+        print(f"    • {rule}", file=out)
     
-    print("  Buy Puts When:")
+    print("  Buy Puts When:", file=out)
     for rule in cheatsheet['trading_rules']['Buy Puts When'][:2]:
-        print(f"    • {rule}")
+        print(f"    • {rule}", file=out)
     
-    print()
+    print(file=out)
 
-def demo_alerts():
+def demo_alerts(out=None):
     """Demo alert system"""
-    print("🚨 DEMO: Alert System")
-    print("-" * 40)
+    print("🚨 DEMO: Alert System", file=out)
+    print("-" * 40, file=out)
     
     alert_system = AlertSystem()
     
     # Setup a demo alert
-    print("Setting up demo breakout alert for NIFTY50...")
+    print("Setting up demo breakout alert for NIFTY50...", file=out)
     
     data_fetcher = IndianMarketDataFetcher()
     levels_data = data_fetcher.get_support_resistance_levels("^NSEI")
@@ -103,21 +118,29 @@ def demo_alerts():
     if levels_data:
         alert_id = alert_system.setup_breakout_alerts("^NSEI", levels_data)
         if alert_id:
-            print(f"✅ Demo alert setup (ID: {alert_id})")
+            print(f"✅ Demo alert setup (ID: {alert_id})", file=out)
             
             # Show active alerts
             active_alerts = alert_system.get_active_alerts()
-            print(f"Active alerts: {len(active_alerts)}")
+            print(f"Active alerts: {len(active_alerts)}", file=out)
             
             # Clean up demo alert
             alert_system.cancel_alert(alert_id)
-            print("🧹 Demo alert cleaned up")
+            print("🧹 Demo alert cleaned up", file=out)
         else:
-            print("❌ Failed to setup demo alert")
+            print("❌ Failed to setup demo alert", file=out)
     else:
-        print("❌ Unable to get support/resistance levels")
+        print("❌ Unable to get support/resistance levels", file=out)
     
-    print()
+    print(file=out)
+
+DEMOS = (demo_market_overview, demo_oi_analysis, demo_cheatsheet, demo_alerts)
+
+def _run_buffered(demo):
+    """Run a demo and return its captured output"""
+    out = io.StringIO()
+    demo(out)
+    return out.getvalue()
 
 def show_usage_instructions():
     """Show usage instructions"""
@@ -152,11 +175,12 @@ def main():
     print()
     
     try:
-        # Run demos
-        demo_market_overview()
-        demo_oi_analysis()
-        demo_cheatsheet()
-        demo_alerts()
+        # Run demos concurrently; each writes to its own buffer so the
+        # output is printed in order without interleaving
+        with ThreadPoolExecutor(max_workers=len(DEMOS)) as executor:
+            futures = [executor.submit(_run_buffered, demo) for demo in DEMOS]
+            for future in futures:
+                sys.stdout.write(future.result())
         
         print("✅ Demo completed successfully!")
         print()
@@ -7,11 +7,11 @@ import os
 import sys
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(args, description):
+    """Run a command (argument list, no shell) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(args, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -43,21 +43,23 @@ def setup_git_repository():
         print("✅ Git repository already exists")
     else:
         # Initialize git repository
-        if not run_command("git init", "Initializing git repository"):
+        if not run_command(["git", "init"], "Initializing git repository"):
             return False
     
     # Add all files
-    if not run_command("git add .", "Adding files to git"):
+    if not run_command(["git", "add", "."], "Adding files to git"):
         return False
     
-    # Check if there are changes to commit
-    result = subprocess.run("git status --porcelain", shell=True, capture_output=True, text=True)
-    if not result.stdout.strip():
+    # Check if there are staged changes to commit (exit code 0 = none)
+    if subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode == 0:
         print("✅ No changes to commit")
         return True
     
     # Commit changes
-    if not run_command('git commit -m "Initial commit - Indian Stock Market AI Agent"', "Committing changes"):
+    if not run_command(
+        ["git", "commit", "-m", "Initial commit - Indian Stock Market AI Agent"],
+        "Committing changes"
+    ):
         return False
     
     print("\n🎉 Git repository setup completed!")
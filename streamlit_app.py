@@ -12,8 +12,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the trading agent
-from trading_agent import IndianStockTradingAgent
+from trading_agent import get_agent
 
-# Create and run the trading agent
-agent = IndianStockTradingAgent()
-agent.run_streamlit_app()
+# Run the trading agent (one cached instance shared across reruns)
+get_agent().run_streamlit_app()
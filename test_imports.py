@@ -1,60 +1,32 @@
 #!/usr/bin/env python3
 """
 Test script to verify all imports work correctly
+
+For import-time profiling use:
+    python -X importtime -c "import trading_agent" 2> importtime.log
 """
+import importlib
+import sys
+
+MODULES = (
+    'streamlit', 'pandas', 'numpy', 'yfinance', 'plotly.graph_objects', 'ta',
+    'config', 'data_fetcher', 'oi_analyzer', 'alert_system',
+    'ai_chat_component', 'trading_agent'
+)
 
 def test_imports():
-    """Test all imports"""
+    """Test all imports in this one process"""
+    print("Testing imports...")
+    
     try:
-        print("Testing imports...")
-        
-        # Test basic imports
-        import streamlit as st
-        print("✅ streamlit imported")
-        
-        import pandas as pd
-        print("✅ pandas imported")
-        
-        import numpy as np
-        print("✅ numpy imported")
-        
-        import yfinance as yf
-        print("✅ yfinance imported")
-        
-        import plotly.graph_objects as go
-        print("✅ plotly imported")
-        
-        import ta
-        print("✅ ta imported")
-        
-        # Test custom imports
-        from config import Config
-        print("✅ config imported")
-        
-        from data_fetcher import IndianMarketDataFetcher
-        print("✅ data_fetcher imported")
-        
-        from oi_analyzer import OIAnalyzer
-        print("✅ oi_analyzer imported")
-        
-        from alert_system import AlertSystem
-        print("✅ alert_system imported")
-        
-        from ai_chat_component import AIChatComponent
-        print("✅ ai_chat_component imported")
-        
-        from trading_agent import IndianStockTradingAgent
-        print("✅ trading_agent imported")
-        
-        print("\n🎉 All imports successful!")
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
+        for name in MODULES:
+            importlib.import_module(name)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"❌ Import error in {name}: {e}")
         return False
+    
+    print(f"🎉 All {len(MODULES)} imports successful!")
+    return True
 
 if __name__ == "__main__":
-    test_imports()
+    sys.exit(0 if test_imports() else 1)
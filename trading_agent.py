@@ -1,29 +1,197 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
-import threading
-import time
+import functools
+import html
 import logging
-from data_fetcher import IndianMarketDataFetcher
-from oi_analyzer import OIAnalyzer
-from alert_system import AlertSystem
+import re
 from config import Config
-from ai_chat_component import AIChatComponent
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_resource
+def _fetcher():
+    """One data fetcher shared by every session and cached helper"""
+    from data_fetcher import IndianMarketDataFetcher
+    return IndianMarketDataFetcher()
+
+# Cached market data shared across reruns and sessions; TTLs follow how
+# quickly each kind of data changes
+@st.cache_data(ttl=15)
+def _cached_overview():
+    return _fetcher().get_market_overview()
+
+@st.cache_data(ttl=5)
+def _cached_live(symbol):
+    return _fetcher().get_live_price(symbol)
+
+@st.cache_data(ttl=60)
+def _cached_hist(symbol, period):
+    return _fetcher().get_historical_data(symbol, period=period)
+
+@st.cache_data(ttl=30)
+def _cached_levels(symbol):
+    return _fetcher().get_support_resistance_levels(symbol)
+
+@st.cache_data(ttl=60)
+def _cached_oi_scan(symbols):
+    from oi_analyzer import OIAnalyzer
+    return OIAnalyzer(_fetcher()).analyze_batch(list(symbols))
+
+# Custom symbols accepted from the sidebar: an index (^NSEI) or an NSE/BSE
+# ticker with its exchange suffix (RELIANCE.NS)
+_VALID_SYMBOL = re.compile(r"\^[A-Z]{3,10}|[A-Z0-9&_-]{1,20}\.(NS|BO)")
+
+# Sidebar choices, fixed for the life of the process
+_MAJOR_INDEX_NAMES = tuple(Config.MAJOR_INDICES)
+_POPULAR_STOCK_NAMES = tuple(Config.POPULAR_STOCKS)
+
+@st.cache_resource
+def _cheatsheet():
+    """The constant OI cheatsheet, without building an analyzer (and its fetcher)"""
+    from oi_analyzer import get_oi_cheatsheet
+    return get_oi_cheatsheet()
+
+# Symbols offered in the Live Charts tab
+_CHART_SYMBOLS = (
+    # Major Indices
+    "^NSEI", "^NSEBANK", "^BSESN", "NIFTY_FIN_SERVICE.NS",
+    # Banking
+    "HDFCBANK.NS", "ICICIBANK.NS", "AXISBANK.NS", "KOTAKBANK.NS", "SBIN.NS",
+    # IT & Technology
+    "TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS",
+    # Oil & Gas
+    "RELIANCE.NS", "ONGC.NS", "IOC.NS", "BPCL.NS", "HPCL.NS",
+    # FMCG
+    "HINDUNILVR.NS", "ITC.NS", "NESTLEIND.NS", "DABUR.NS", "TITAN.NS",
+    # Auto
+    "MARUTI.NS", "TATAMOTORS.NS", "M&M.NS", "BAJAJ-AUTO.NS", "HEROMOTOCO.NS",
+    # Pharma
+    "SUNPHARMA.NS", "DRREDDY.NS", "CIPLA.NS", "DIVISLAB.NS", "BIOCON.NS",
+    # Telecom
+    "BHARTIARTL.NS", "IDEA.NS",
+    # Power
+    "NTPC.NS", "POWERGRID.NS", "TATAPOWER.NS",
+    # Metals
+    "TATASTEEL.NS", "JSWSTEEL.NS", "HINDALCO.NS", "VEDL.NS", "COALINDIA.NS",
+    # Cement
+    "ULTRACEMCO.NS", "SHREECEM.NS", "GRASIM.NS", "AMBUJACEM.NS",
+    # Real Estate
+    "DLF.NS", "GODREJPROP.NS",
+    # Media
+    "ZEEL.NS", "SUNTV.NS", "PVR.NS",
+    # Aviation
+    "INDIGO.NS", "SPICEJET.NS",
+    # E-commerce
+    "NYKAA.NS", "ZOMATO.NS", "PAYTM.NS",
+    # Infrastructure
+    "LT.NS", "ADANIPORTS.NS", "IRCTC.NS",
+    # Small & Mid Cap
+    "POLYCAB.NS", "ASTRAL.NS", "CROMPTON.NS", "HAVELLS.NS", "VOLTAS.NS"
+)
+
+_METRIC_CARD = (
+    '<div style="flex:1 1 22%;min-width:140px">'
+    '<div style="font-size:0.875rem;opacity:0.7">{label}</div>'
+    '<div style="font-size:1.75rem">{value}</div>{delta}</div>'
+)
+
+def _render_metrics(metrics):
+    """Render (label, value, delta) metrics four per row
+    
+    With Config.HTML_METRIC_CARDS the whole row set is sent as a single
+    markdown element instead of one st.metric widget per value.
+    """
+    if not Config.HTML_METRIC_CARDS:
+        for start in range(0, len(metrics), 4):
+            for col, (label, value, delta) in zip(st.columns(4), metrics[start:start + 4]):
+                with col:
+                    st.metric(label, value, delta)
+        return
+    
+    cards = []
+    for label, value, delta in metrics:
+        if delta:
+            color = '#ff2b2b' if delta.startswith('-') else '#09ab3b'
+            delta = f'<div style="color:{color}">{html.escape(delta)}</div>'
+        cards.append(_METRIC_CARD.format(
+            label=html.escape(label), value=html.escape(value), delta=delta or ''
+        ))
+    st.markdown(
+        f'<div style="display:flex;flex-wrap:wrap;gap:1rem">{"".join(cards)}</div>',
+        unsafe_allow_html=True
+    )
+
+def _build_candlestick(symbol, hist_data):
+    """Candlestick figure for a symbol's history"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Candlestick(
+        x=hist_data.index,
+        open=hist_data['Open'],
+        high=hist_data['High'],
+        low=hist_data['Low'],
+        close=hist_data['Close']
+    )])
+    
+    fig.update_layout(
+        title=f"{symbol} - 1 Month Chart",
+        xaxis_title="Date",
+        yaxis_title="Price (₹)",
+        height=500
+    )
+    return fig
+
+def _merge_candles(trace, tail):
+    """Update a candlestick trace in place with the latest bars
+    
+    Bars from the start of `tail` onwards are replaced (the last one may
+    still be forming) and the window keeps its original length.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    x = pd.DatetimeIndex(trace.x)
+    keep = np.asarray(x < tail.index[0])
+    size = len(x)
+    
+    def merged(old, new):
+        return np.concatenate([np.asarray(old)[keep], new.to_numpy()])[-size:]
+    
+    trace.update(
+        x=x[keep].append(tail.index)[-size:],
+        open=merged(trace.open, tail['Open']),
+        high=merged(trace.high, tail['High']),
+        low=merged(trace.low, tail['Low']),
+        close=merged(trace.close, tail['Close'])
+    )
+
 class IndianStockTradingAgent:
-    def __init__(self):
-        self.config = Config()
-        self.data_fetcher = IndianMarketDataFetcher()
-        self.oi_analyzer = OIAnalyzer()
-        self.alert_system = AlertSystem()
-        self.ai_chat = AIChatComponent()
-        self.monitoring_thread = None
-        self.is_monitoring = False
+    # Subsystems are imported and built on first use, so the first frame
+    # doesn't wait for pandas/yfinance/plotly to load, and tabs that are
+    # never opened never construct theirs
+    @functools.cached_property
+    def config(self):
+        return Config()
+    
+    @functools.cached_property
+    def data_fetcher(self):
+        return _fetcher()
+    
+    @functools.cached_property
+    def oi_analyzer(self):
+        from oi_analyzer import OIAnalyzer
+        return OIAnalyzer()
+    
+    @functools.cached_property
+    def alert_system(self):
+        from alert_system import AlertSystem
+        return AlertSystem()
+    
+    @functools.cached_property
+    def ai_chat(self):
+        from ai_chat_component import AIChatComponent
+        return AIChatComponent()
         
     def run_streamlit_app(self):
         """Run the Streamlit web application"""
@@ -40,7 +208,8 @@ class IndianStockTradingAgent:
         # Sidebar
         self._create_sidebar()
         
-        # Main content
+        # Main content; each tab body is a fragment, so a widget change in
+        # one tab reruns only that tab
         tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
             "📊 Market Overview", 
             "🔍 OI Analysis", 
@@ -58,6 +227,9 @@ class IndianStockTradingAgent:
         
         with tab3:
             self._alerts_tab()
+            # Periodic alert checks (only run while monitoring is on); kept
+            # outside the tab's own fragment so its timer reruns only itself
+            self._monitoring_fragment()
         
         with tab4:
             self._cheatsheet_tab()
@@ -79,7 +251,7 @@ class IndianStockTradingAgent:
         st.sidebar.write("**Major Indices:**")
         selected_index = st.sidebar.selectbox(
             "Choose Index:",
-            list(self.config.MAJOR_INDICES.keys()),
+            _MAJOR_INDEX_NAMES,
             key="index_select"
         )
         
@@ -87,7 +259,7 @@ class IndianStockTradingAgent:
         st.sidebar.write("**Popular Stocks:**")
         selected_stock = st.sidebar.selectbox(
             "Choose Stock:",
-            list(self.config.POPULAR_STOCKS.keys()),
+            _POPULAR_STOCK_NAMES,
             key="stock_select"
         )
         
@@ -97,7 +269,13 @@ class IndianStockTradingAgent:
             placeholder="Enter symbol..."
         )
         
-        # Determine active symbol
+        # Determine active symbol; an incomplete/invalid custom symbol falls
+        # back to the selection above instead of being fetched
+        custom_symbol = custom_symbol.strip().upper()
+        if custom_symbol and not _VALID_SYMBOL.fullmatch(custom_symbol):
+            st.sidebar.warning("Enter a full NSE/BSE symbol, e.g. RELIANCE.NS")
+            custom_symbol = ""
+        
         if custom_symbol:
             active_symbol = custom_symbol
         elif st.sidebar.checkbox("Use Stock instead of Index"):
@@ -105,10 +283,7 @@ class IndianStockTradingAgent:
         else:
             active_symbol = self.config.MAJOR_INDICES[selected_index]
         
-        if 'active_symbol' not in st.session_state:
-            st.session_state['active_symbol'] = active_symbol
-        else:
-            st.session_state['active_symbol'] = active_symbol
+        st.session_state['active_symbol'] = active_symbol
         
         # Alert controls
         st.sidebar.subheader("🚨 Alert Controls")
@@ -122,48 +297,78 @@ class IndianStockTradingAgent:
         # Quick actions
         st.sidebar.subheader("⚡ Quick Actions")
         
-        if st.sidebar.button("Analyze Current Symbol"):
-            st.session_state['analyze_symbol'] = active_symbol
-        
-        if st.sidebar.button("Setup Breakout Alerts"):
-            st.session_state['setup_alerts'] = active_symbol
+        if st.sidebar.button("Analyze Current Symbol", key="quick_analyze"):
+            with st.sidebar, st.spinner("Analyzing OI data..."):
+                analysis = self.oi_analyzer.analyze_oi_data(active_symbol)
+            if analysis:
+                st.session_state['oi_analysis'] = analysis
+                st.sidebar.success("Analysis ready in the OI Analysis tab")
+            else:
+                st.sidebar.error(f"Unable to analyze {active_symbol}")
+        
+        if st.sidebar.button("Setup Breakout Alerts", key="quick_breakout_alerts"):
+            levels_data = _cached_levels(active_symbol)
+            alert_id = levels_data and self.alert_system.setup_breakout_alerts(active_symbol, levels_data)
+            if alert_id:
+                st.session_state['alert_id'] = alert_id
+                st.sidebar.success(f"Breakout alerts setup for {active_symbol}")
+            else:
+                st.sidebar.error(f"Failed to setup breakout alerts for {active_symbol}")
     
+    @st.fragment
     def _market_overview_tab(self):
         """Market overview tab"""
+        import numpy as np
+        import pandas as pd
+        
         st.header("📊 Market Overview")
         
         # Get market overview
-        overview = self.data_fetcher.get_market_overview()
+        overview = _cached_overview()
         
         if overview:
             # Create metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            for i, (name, data) in enumerate(overview.items()):
-                with [col1, col2, col3, col4][i]:
-                    st.metric(
-                        label=name,
-                        value=f"₹{data['price']:,.2f}",
-                        delta=f"{data['change_percent']:.2f}%"
-                    )
+            _render_metrics([
+                (name, f"₹{data['price']:,.2f}", f"{data['change_percent']:.2f}%")
+                for name, data in overview.items()
+            ])
             
             # Market overview table
             st.subheader("Detailed Market Data")
             
-            overview_df = pd.DataFrame([
-                {
-                    'Index': name,
-                    'Price': f"₹{data['price']:,.2f}",
-                    'Change': f"₹{data['change']:,.2f}",
-                    'Change %': f"{data['change_percent']:.2f}%",
-                    'Volume': f"{data['volume']:,.0f}",
-                    'High': f"₹{data['high']:,.2f}",
-                    'Low': f"₹{data['low']:,.2f}"
-                }
-                for name, data in overview.items()
-            ])
-            
-            st.dataframe(overview_df, width='stretch')
+            # Build numeric columns; the frontend formats them via column_config
+            rows = overview.values()
+            overview_df = pd.DataFrame({
+                'Index': list(overview),
+                'Price': np.fromiter((data['price'] for data in rows), dtype=np.float64, count=len(overview)),
+                'Change': np.fromiter((data['change'] for data in rows), dtype=np.float64, count=len(overview)),
+                'Change %': np.fromiter((data['change_percent'] for data in rows), dtype=np.float64, count=len(overview)),
+                'Volume': np.fromiter((data['volume'] for data in rows), dtype=np.float64, count=len(overview)),
+                'High': np.fromiter((data['high'] for data in rows), dtype=np.float64, count=len(overview)),
+                'Low': np.fromiter((data['low'] for data in rows), dtype=np.float64, count=len(overview))
+            })
+            
+            st.dataframe(overview_df, column_config={
+                'Price': st.column_config.NumberColumn(format="₹%.2f"),
+                'Change': st.column_config.NumberColumn(format="₹%.2f"),
+                'Change %': st.column_config.NumberColumn(format="%.2f%%"),
+                'Volume': st.column_config.NumberColumn(format="%d"),
+                'High': st.column_config.NumberColumn(format="₹%.2f"),
+                'Low': st.column_config.NumberColumn(format="₹%.2f")
+            }, width='stretch')
+        
+        # OI signals for all major indices, classified in one batch
+        st.subheader("🔍 Index OI Scan")
+        oi_scan = _cached_oi_scan(tuple(Config.MAJOR_INDICES.values()))
+        
+        if not oi_scan.empty:
+            st.dataframe(oi_scan, column_config={
+                'price': st.column_config.NumberColumn(format="₹%.2f"),
+                'pcr': st.column_config.NumberColumn(format="%.2f"),
+                'rsi': st.column_config.NumberColumn(format="%.1f")
+            }, hide_index=True, width='stretch')
+        else:
+            st.info("OI scan data is not available right now")
         
         # Active symbol analysis
         if 'active_symbol' in st.session_state:
@@ -172,44 +377,47 @@ class IndianStockTradingAgent:
             st.subheader(f"📈 {active_symbol} Analysis")
             
             # Get live data
-            live_data = self.data_fetcher.get_live_price(active_symbol)
+            live_data = _cached_live(active_symbol)
             if live_data:
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Current Price", f"₹{live_data['price']:,.2f}")
-                
-                with col2:
-                    st.metric("Change", f"₹{live_data['change']:,.2f}", f"{live_data['change_percent']:.2f}%")
-                
-                with col3:
-                    st.metric("Volume", f"{live_data['volume']:,.0f}")
-                
-                with col4:
-                    st.metric("Day Range", f"₹{live_data['low']:,.2f} - ₹{live_data['high']:,.2f}")
+                _render_metrics([
+                    ("Current Price", f"₹{live_data['price']:,.2f}", None),
+                    ("Change", f"₹{live_data['change']:,.2f}", f"{live_data['change_percent']:.2f}%"),
+                    ("Volume", f"{live_data['volume']:,.0f}", None),
+                    ("Day Range", f"₹{live_data['low']:,.2f} - ₹{live_data['high']:,.2f}", None)
+                ])
                 
                 # Price chart
                 st.subheader("Price Chart")
-                hist_data = self.data_fetcher.get_historical_data(active_symbol, period="1mo")
+                fig = self._candlestick_figure(active_symbol)
                 
-                if hist_data is not None:
-                    fig = go.Figure(data=[go.Candlestick(
-                        x=hist_data.index,
-                        open=hist_data['Open'],
-                        high=hist_data['High'],
-                        low=hist_data['Low'],
-                        close=hist_data['Close']
-                    )])
-                    
-                    fig.update_layout(
-                        title=f"{active_symbol} - 1 Month Chart",
-                        xaxis_title="Date",
-                        yaxis_title="Price (₹)",
-                        height=500
-                    )
-                    
-                    st.plotly_chart(fig, width='stretch')
+                if fig is not None:
+                    # A stable key keeps the same chart element across refreshes
+                    st.plotly_chart(fig, width='stretch', key="candle")
+    
+    def _candlestick_figure(self, symbol):
+        """This session's candlestick figure for symbol
+        
+        The month of history is fetched once per symbol; afterwards (while
+        auto-refresh is on) only the last few days are fetched and merged in.
+        """
+        cached = st.session_state.get('candle_fig')
+        
+        if cached is None or cached[0] != symbol:
+            hist_data = _cached_hist(symbol, "1mo")
+            if hist_data is None or not len(hist_data):
+                return None
+            fig = _build_candlestick(symbol, hist_data)
+            st.session_state['candle_fig'] = (symbol, fig)
+            return fig
+        
+        fig = cached[1]
+        if st.session_state.get('auto_refresh', True):
+            tail = _cached_hist(symbol, "5d")
+            if tail is not None and len(tail):
+                _merge_candles(fig.data[0], tail)
+        return fig
     
+    @st.fragment
     def _oi_analysis_tab(self):
         """OI Analysis tab"""
         st.header("🔍 OI Analysis & PCR Calculator")
@@ -236,38 +444,38 @@ class IndianStockTradingAgent:
             # PCR Analysis
             st.subheader("📊 PCR (Put-Call Ratio) Analysis")
             
-            oi_analysis = analysis.get('oi_analysis', {})
-            pcr_interpretation = oi_analysis.get('pcr_interpretation', {})
+            oi_analysis = analysis['oi_analysis']
+            pcr_interpretation = oi_analysis.pcr_interpretation
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.metric(
                     "PCR Signal",
-                    pcr_interpretation.get('signal', 'NEUTRAL'),
-                    help=pcr_interpretation.get('interpretation', '')
+                    pcr_interpretation.signal,
+                    help=pcr_interpretation.interpretation
                 )
             
             with col2:
                 st.metric(
                     "Confidence",
-                    pcr_interpretation.get('confidence', 'LOW')
+                    pcr_interpretation.confidence
                 )
             
             with col3:
                 st.metric(
                     "Recommended Action",
-                    pcr_interpretation.get('action', 'Follow technicals')
+                    pcr_interpretation.action
                 )
             
             # OI Patterns
             st.subheader("📈 OI Patterns")
             
-            oi_buildup = oi_analysis.get('oi_buildup', {})
-            st.info(f"**Pattern:** {oi_buildup.get('pattern', 'BALANCED')}")
-            st.write(f"**Interpretation:** {oi_buildup.get('interpretation', 'Normal OI distribution')}")
-            st.write(f"**Risk Level:** {oi_buildup.get('risk_level', 'LOW')}")
-            st.write(f"**Timeframe:** {oi_buildup.get('timeframe', 'MEDIUM_TERM')}")
+            oi_buildup = oi_analysis.oi_buildup
+            st.info(f"**Pattern:** {oi_buildup.pattern}")
+            st.write(f"**Interpretation:** {oi_buildup.interpretation}")
+            st.write(f"**Risk Level:** {oi_buildup.risk_level}")
+            st.write(f"**Timeframe:** {oi_buildup.timeframe}")
             
             # Trading Signals
             st.subheader("🎯 Trading Signals")
@@ -276,24 +484,24 @@ class IndianStockTradingAgent:
             
             if signals:
                 for i, signal in enumerate(signals):
-                    with st.expander(f"Signal {i+1}: {signal.get('type', 'UNKNOWN')}"):
+                    with st.expander(f"Signal {i+1}: {signal.type}"):
                         col1, col2 = st.columns(2)
                         
                         with col1:
-                            st.write(f"**Type:** {signal.get('type', 'N/A')}")
-                            st.write(f"**Reason:** {signal.get('reason', 'N/A')}")
-                            st.write(f"**Confidence:** {signal.get('confidence', 'N/A')}")
+                            st.write(f"**Type:** {signal.type}")
+                            st.write(f"**Reason:** {signal.reason}")
+                            st.write(f"**Confidence:** {signal.confidence}")
                         
                         with col2:
-                            st.write(f"**Timeframe:** {signal.get('timeframe', 'N/A')}")
-                            st.write(f"**Risk Level:** {signal.get('risk_level', 'N/A')}")
+                            st.write(f"**Timeframe:** {signal.timeframe}")
+                            st.write(f"**Risk Level:** {signal.risk_level}")
             else:
                 st.warning("No trading signals generated at this time.")
             
             # Support/Resistance Levels
             st.subheader("🏗️ Support & Resistance Levels")
             
-            levels_data = self.data_fetcher.get_support_resistance_levels(symbol)
+            levels_data = _cached_levels(symbol)
             if levels_data:
                 col1, col2 = st.columns(2)
                 
@@ -317,6 +525,7 @@ class IndianStockTradingAgent:
                 if nearest_support:
                     st.write(f"**Nearest Support:** ₹{nearest_support:,.2f}")
     
+    @st.fragment
     def _alerts_tab(self):
         """Alerts and signals tab"""
         st.header("🚨 Alerts & Trading Signals")
@@ -334,7 +543,7 @@ class IndianStockTradingAgent:
             )
             
             if st.button("Setup Breakout Alerts"):
-                levels_data = self.data_fetcher.get_support_resistance_levels(alert_symbol)
+                levels_data = _cached_levels(alert_symbol)
                 if levels_data:
                     alert_id = self.alert_system.setup_breakout_alerts(alert_symbol, levels_data)
                     if alert_id:
@@ -382,10 +591,10 @@ class IndianStockTradingAgent:
         # Alert history
         st.subheader("Alert History")
         
-        alert_history = self.alert_system.get_alert_history()
+        alert_history = self.alert_system.get_alert_history(limit=5)  # Show last 5 alerts
         
         if alert_history:
-            for alert in alert_history[-5:]:  # Show last 5 alerts
+            for alert in alert_history:
                 with st.expander(f"History: {alert['symbol']} - {alert['status']}"):
                     st.write(f"**Type:** {alert.get('alert_type', 'UNKNOWN')}")
                     st.write(f"**Created:** {alert['created_at']}")
@@ -401,20 +610,23 @@ class IndianStockTradingAgent:
         else:
             st.info("No alert history.")
     
+    @st.fragment
     def _cheatsheet_tab(self):
         """Master cheatsheet tab"""
+        import pandas as pd
+        
         st.header("📋 Master OI Trading Cheatsheet")
         
-        cheatsheet = self.oi_analyzer.get_oi_cheatsheet()
+        cheatsheet = _cheatsheet()
         
         # PCR Interpretation
         st.subheader("📊 PCR Interpretation Guide")
         
         pcr_guide = cheatsheet['pcr_interpretation']
-        pcr_df = pd.DataFrame([
-            {'PCR Range': k, 'Action': v}
-            for k, v in pcr_guide.items()
-        ])
+        pcr_df = pd.DataFrame({
+            'PCR Range': list(pcr_guide),
+            'Action': list(pcr_guide.values())
+        })
         
         st.dataframe(pcr_df, width='stretch')
         
@@ -473,6 +685,7 @@ class IndianStockTradingAgent:
         - Volume spike = strong move likely
         """)
     
+    @st.fragment
     def _settings_tab(self):
         """Settings tab"""
         st.header("⚙️ Settings & Configuration")
@@ -535,36 +748,28 @@ class IndianStockTradingAgent:
     
     def _start_monitoring(self, symbol):
         """Start monitoring for alerts"""
-        if not self.is_monitoring:
-            self.is_monitoring = True
-            self.monitoring_thread = threading.Thread(
-                target=self._monitoring_loop,
-                args=(symbol,),
-                daemon=True
-            )
-            self.monitoring_thread.start()
+        if not st.session_state.get('monitoring_on'):
+            st.session_state['monitoring_on'] = True
             st.success(f"Started monitoring {symbol}")
     
     def _stop_monitoring(self):
         """Stop monitoring"""
-        self.is_monitoring = False
+        st.session_state['monitoring_on'] = False
         st.success("Stopped monitoring")
     
-    def _monitoring_loop(self, symbol):
-        """Monitoring loop for alerts"""
-        while self.is_monitoring:
-            try:
-                # Check alerts
-                self.alert_system.check_breakout_alerts()
-                self.alert_system.check_pcr_alerts()
-                self.alert_system.check_volume_alerts()
-                
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(60)
+    @st.fragment(run_every=30)
+    def _monitoring_fragment(self):
+        """Check alerts every 30 seconds while monitoring is on"""
+        if not st.session_state.get('monitoring_on'):
+            return
+        
+        try:
+            self.alert_system.check_all_alerts()
+            st.caption(f"🟢 Monitoring active - last check {datetime.now().strftime('%H:%M:%S')}")
+        except Exception as e:
+            logger.error(f"Error in monitoring loop: {e}")
     
+    @st.fragment
     def _ai_chat_tab(self):
         """AI Chat Assistant tab"""
         st.header("🤖 AI Trading Assistant")
@@ -585,42 +790,7 @@ class IndianStockTradingAgent:
             with col1:
                 chart_symbol = st.selectbox(
                     "Select Symbol for Live Chart:",
-                    [
-                        # Major Indices
-                        "^NSEI", "^NSEBANK", "^BSESN", "NIFTY_FIN_SERVICE.NS",
-                        # Banking
-                        "HDFCBANK.NS", "ICICIBANK.NS", "AXISBANK.NS", "KOTAKBANK.NS", "SBIN.NS",
-                        # IT & Technology
-                        "TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS",
-                        # Oil & Gas
-                        "RELIANCE.NS", "ONGC.NS", "IOC.NS", "BPCL.NS", "HPCL.NS",
-                        # FMCG
-                        "HINDUNILVR.NS", "ITC.NS", "NESTLEIND.NS", "DABUR.NS", "TITAN.NS",
-                        # Auto
-                        "MARUTI.NS", "TATAMOTORS.NS", "M&M.NS", "BAJAJ-AUTO.NS", "HEROMOTOCO.NS",
-                        # Pharma
-                        "SUNPHARMA.NS", "DRREDDY.NS", "CIPLA.NS", "DIVISLAB.NS", "BIOCON.NS",
-                        # Telecom
-                        "BHARTIARTL.NS", "IDEA.NS",
-                        # Power
-                        "NTPC.NS", "POWERGRID.NS", "TATAPOWER.NS",
-                        # Metals
-                        "TATASTEEL.NS", "JSWSTEEL.NS", "HINDALCO.NS", "VEDL.NS", "COALINDIA.NS",
-                        # Cement
-                        "ULTRACEMCO.NS", "SHREECEM.NS", "GRASIM.NS", "AMBUJACEM.NS",
-                        # Real Estate
-                        "DLF.NS", "GODREJPROP.NS",
-                        # Media
-                        "ZEEL.NS", "SUNTV.NS", "PVR.NS",
-                        # Aviation
-                        "INDIGO.NS", "SPICEJET.NS",
-                        # E-commerce
-                        "NYKAA.NS", "ZOMATO.NS", "PAYTM.NS",
-                        # Infrastructure
-                        "LT.NS", "ADANIPORTS.NS", "IRCTC.NS",
-                        # Small & Mid Cap
-                        "POLYCAB.NS", "ASTRAL.NS", "CROMPTON.NS", "HAVELLS.NS", "VOLTAS.NS"
-                    ],
+                    _CHART_SYMBOLS,
                     key="chart_symbol"
                 )
             
@@ -648,10 +818,18 @@ class IndianStockTradingAgent:
                 st.checkbox("Show Support/Resistance", value=True, key="show_sr")
                 st.checkbox("Auto-refresh", value=True, key="auto_refresh")
 
+@st.cache_resource
+def get_agent():
+    """The trading agent, built once per server and reused across reruns
+    
+    Keeping one instance keeps active alerts and the loaded subsystems
+    alive between reruns instead of rebuilding them on every interaction.
+    """
+    return IndianStockTradingAgent()
+
 def main():
     """Main function to run the trading agent"""
-    agent = IndianStockTradingAgent()
-    agent.run_streamlit_app()
+    get_agent().run_streamlit_app()
 
 if __name__ == "__main__":
     main()
@@ -4,15 +4,24 @@ TradingView Alert Script for Advanced Intraday Trading
 Receives webhook alerts from TradingView and executes trades on DHAN/GROWW/SENSIBULL
 """
 
-import json
 import requests
+import asyncio
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import time
 from datetime import datetime
-from typing import Dict, Optional
-from flask import Flask, request, jsonify
+from typing import Optional
+from contextlib import asynccontextmanager
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request, Header
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
 import threading
-from queue import Queue
+import itertools
+from queue import SimpleQueue
+from collections import deque
 import hmac
 import hashlib
 import base64
@@ -21,71 +30,150 @@ import base64
 from advanced_trading_engine import AdvancedTradingEngine, TradingSignal, OrderSide, OrderType, BrokerType
 from advanced_config import CONFIG
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+# Configure logging; records are written by a listener thread so webhook
+# handlers never block on log I/O
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue = SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Flask app for webhook
-app = Flask(__name__)
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(_log_queue)], force=True)
+logger = logging.getLogger(__name__)
 
 # Trading engine instance
 trading_engine = None
-alert_queue = Queue()
+alert_handler = None
+alert_deque = deque()
+_alert_ready = threading.Event()
+_signal_counter = itertools.count(1).__next__
+
+# Signature checks are switched on or off once, at import
+_REQUIRE_SIG = bool(CONFIG.WEBHOOK_SECRET)
+_MAC_ALG = CONFIG.WEBHOOK_MAC.lower()
+
+# Alert action and broker lookups
+_BUY_ACTIONS = frozenset({'BUY', 'LONG', 'CALL'})
+_SELL_ACTIONS = frozenset({'SELL', 'SHORT', 'PUT'})
+_BROKER_MAP = {
+    'dhan': BrokerType.DHAN,
+    'groww': BrokerType.GROWW,
+    'sensibull': BrokerType.SENSIBULL
+}
+
+# Default SL/TP multipliers, resolved once from config
+_BUY_SL_FACTOR = 1 - CONFIG.DEFAULT_STOP_LOSS_PERCENTAGE
+_SELL_SL_FACTOR = 1 + CONFIG.DEFAULT_STOP_LOSS_PERCENTAGE
+_BUY_TP_FACTOR = 1 + CONFIG.DEFAULT_TAKE_PROFIT_PERCENTAGE
+_SELL_TP_FACTOR = 1 - CONFIG.DEFAULT_TAKE_PROFIT_PERCENTAGE
+
+@asynccontextmanager
+async def lifespan(app):
+    """Run the trading engine on the webhook server's event loop"""
+    global trading_engine, alert_handler
+    
+    try:
+        trading_engine = AdvancedTradingEngine(CONFIG.__dict__)
+        alert_handler = TradingViewAlertHandler(trading_engine)
+        logger.info("✅ Trading engine initialized")
+    except Exception as e:
+        logger.error("❌ Failed to initialize trading engine: %s", e)
+        raise
+    
+    engine_task = asyncio.create_task(trading_engine.start_trading())
+    threading.Thread(target=_alert_worker, daemon=True).start()
+    
+    yield
+    
+    trading_engine.is_running = False
+    engine_task.cancel()
+
+# FastAPI app for webhook
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+class AlertMsg(BaseModel):
+    """Webhook alert payload, decoded and type-checked in one pass"""
+    symbol: str = Field(min_length=1)
+    strategy: str = 'TradingView'
+    action: str
+    price: float = Field(gt=0)
+    quantity: int = 100
+    stop_loss: float = 0.0
+    take_profit: float = 0.0
+    confidence: float = 0.7
+    broker: str = 'dhan'
+    
+    @field_validator('symbol', 'action')
+    @classmethod
+    def _upper_case(cls, value: str) -> str:
+        # Pine scripts already send upper case; only copy when needed
+        return value if value.isupper() else value.upper()
+    
+    @field_validator('action')
+    @classmethod
+    def _known_action(cls, value: str) -> str:
+        if value not in _BUY_ACTIONS and value not in _SELL_ACTIONS:
+            raise ValueError(f"unknown action {value!r}")
+        return value
+    
+    @field_validator('broker')
+    @classmethod
+    def _lower_case(cls, value: str) -> str:
+        return value if value.islower() else value.lower()
 
 class TradingViewAlertHandler:
     """Handle TradingView alerts and convert to trading signals"""
     
     def __init__(self, trading_engine: AdvancedTradingEngine):
         self.trading_engine = trading_engine
-        self.webhook_secret = CONFIG.get('webhook_secret', 'your_webhook_secret')
+        self.webhook_secret = CONFIG.WEBHOOK_SECRET
+        self._secret_bytes = self.webhook_secret.encode()
+        self._hmac_template = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
         
-    def process_alert(self, alert_data: Dict) -> Optional[TradingSignal]:
+    def process_alert(self, alert: AlertMsg) -> Optional[TradingSignal]:
         """Process TradingView alert and convert to trading signal"""
         try:
             # Extract alert information
-            symbol = alert_data.get('symbol', '').upper()
-            strategy = alert_data.get('strategy', 'TradingView')
-            action = alert_data.get('action', '').upper()
-            price = float(alert_data.get('price', 0))
-            quantity = int(alert_data.get('quantity', 100))
-            stop_loss = float(alert_data.get('stop_loss', 0))
-            take_profit = float(alert_data.get('take_profit', 0))
-            confidence = float(alert_data.get('confidence', 0.7))
-            broker = alert_data.get('broker', 'dhan').lower()
+            symbol = alert.symbol
+            strategy = alert.strategy
+            action = alert.action
+            price = alert.price
+            quantity = alert.quantity
+            stop_loss = alert.stop_loss
+            take_profit = alert.take_profit
+            confidence = alert.confidence
+            broker = alert.broker
             
             # Validate required fields
             if not symbol or not action or price <= 0:
-                logger.error(f"Invalid alert data: {alert_data}")
+                logger.error("Invalid alert data: %s", alert)
                 return None
             
             # Convert action to order side
-            if action in ['BUY', 'LONG', 'CALL']:
+            if action in _BUY_ACTIONS:
                 side = OrderSide.BUY
-            elif action in ['SELL', 'SHORT', 'PUT']:
+            elif action in _SELL_ACTIONS:
                 side = OrderSide.SELL
             else:
-                logger.error(f"Invalid action: {action}")
+                logger.error("Invalid action: %s", action)
                 return None
             
             # Convert broker string to enum
-            broker_enum = {
-                'dhan': BrokerType.DHAN,
-                'groww': BrokerType.GROWW,
-                'sensibull': BrokerType.SENSIBULL
-            }.get(broker, BrokerType.DHAN)
+            broker_enum = _BROKER_MAP.get(broker, BrokerType.DHAN)
             
             # Calculate default SL/TP if not provided
             if stop_loss <= 0:
                 if side == OrderSide.BUY:
-                    stop_loss = price * (1 - CONFIG.DEFAULT_STOP_LOSS_PERCENTAGE)
+                    stop_loss = price * _BUY_SL_FACTOR
                 else:
-                    stop_loss = price * (1 + CONFIG.DEFAULT_STOP_LOSS_PERCENTAGE)
+                    stop_loss = price * _SELL_SL_FACTOR
             
             if take_profit <= 0:
                 if side == OrderSide.BUY:
-                    take_profit = price * (1 + CONFIG.DEFAULT_TAKE_PROFIT_PERCENTAGE)
+                    take_profit = price * _BUY_TP_FACTOR
                 else:
-                    take_profit = price * (1 - CONFIG.DEFAULT_TAKE_PROFIT_PERCENTAGE)
+                    take_profit = price * _SELL_TP_FACTOR
             
             # Create trading signal
             signal = TradingSignal(
@@ -102,133 +190,128 @@ class TradingViewAlertHandler:
                 broker=broker_enum
             )
             
-            logger.info(f"✅ TradingView alert processed: {symbol} {action} {quantity} @ {price}")
+            logger.info("✅ TradingView alert processed: %s %s %s @ %s", symbol, action, quantity, price)
             return signal
             
         except Exception as e:
-            logger.error(f"Error processing TradingView alert: {e}")
+            logger.error("Error processing TradingView alert: %s", e)
             return None
     
-    def validate_webhook_signature(self, payload: str, signature: str) -> bool:
-        """Validate TradingView webhook signature"""
+    def validate_webhook_signature(self, payload: bytes, signature: str) -> bool:
+        """Validate TradingView webhook signature (hex HMAC-SHA256 or keyed BLAKE2b of the raw body)"""
         try:
-            expected_signature = hmac.new(
-                self.webhook_secret.encode(),
-                payload.encode(),
-                hashlib.sha256
-            ).hexdigest()
+            if _MAC_ALG == 'blake2b':
+                expected_signature = hashlib.blake2b(payload, key=self._secret_bytes, digest_size=32).digest()
+            else:
+                mac = self._hmac_template.copy()
+                mac.update(payload)
+                expected_signature = mac.digest()
+            
+            try:
+                provided_signature = bytes.fromhex(signature)
+            except ValueError:
+                return False
             
-            return hmac.compare_digest(signature, expected_signature)
+            return hmac.compare_digest(expected_signature, provided_signature)
         except Exception as e:
-            logger.error(f"Error validating webhook signature: {e}")
+            logger.error("Error validating webhook signature: %s", e)
             return False
 
 # Webhook endpoints
-@app.route('/webhook/tradingview', methods=['POST'])
-def tradingview_webhook():
+@app.post('/webhook/tradingview')
+async def tradingview_webhook(request: Request, x_signature: str = Header('')):
     """Handle TradingView webhook alerts"""
     try:
-        # Get request data
-        payload = request.get_data(as_text=True)
-        signature = request.headers.get('X-Signature', '')
+        # Get raw request body; it is both signed and parsed as bytes
+        payload = await request.body()
         
         # Validate signature (if configured)
-        if CONFIG.get('webhook_secret'):
-            if not TradingViewAlertHandler.validate_webhook_signature(payload, signature):
-                logger.warning("Invalid webhook signature")
-                return jsonify({'error': 'Invalid signature'}), 401
+        if _REQUIRE_SIG and not alert_handler.validate_webhook_signature(payload, x_signature):
+            logger.warning("Invalid webhook signature")
+            return ORJSONResponse({'error': 'Invalid signature'}, status_code=401)
         
-        # Parse JSON data
-        alert_data = json.loads(payload)
-        logger.info(f"📨 Received TradingView alert: {alert_data}")
+        # Parse and validate JSON data
+        alert_data = AlertMsg.model_validate_json(payload)
+        logger.info("📨 Received TradingView alert: %s %s", alert_data.symbol, alert_data.action)
+        logger.debug("TradingView payload: %r", payload)
         
-        # Process alert
+        # Hand the alert to the worker thread
         if trading_engine:
-            handler = TradingViewAlertHandler(trading_engine)
-            signal = handler.process_alert(alert_data)
-            
-            if signal:
-                # Add to trading engine signal queue
-                trading_engine.signal_queue.put(signal)
-                logger.info(f"🚀 Signal queued for execution: {signal.symbol} {signal.side.value}")
-                
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Signal processed: {signal.symbol} {signal.side.value}',
-                    'signal_id': id(signal)
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'message': 'Failed to process alert'
-                }), 400
+            signal_id = _signal_counter()
+            alert_deque.append((signal_id, alert_data))
+            _alert_ready.set()
+            return ORJSONResponse({'status': 'queued', 'signal_id': signal_id}, status_code=202)
         else:
-            return jsonify({
+            return ORJSONResponse({
                 'status': 'error',
                 'message': 'Trading engine not initialized'
-            }), 500
+            }, status_code=500)
             
+    except ValidationError as e:
+        logger.error("Invalid TradingView alert: %s", e)
+        return ORJSONResponse({
+            'status': 'error',
+            'message': 'Invalid alert data'
+        }, status_code=400)
     except Exception as e:
-        logger.error(f"Error handling TradingView webhook: {e}")
-        return jsonify({
+        logger.error("Error handling TradingView webhook: %s", e)
+        return ORJSONResponse({
             'status': 'error',
-            'message': str(e)
-        }), 500
+            'message': 'Internal server error'
+        }, status_code=500)
 
-@app.route('/webhook/custom', methods=['POST'])
-def custom_webhook():
+@app.post('/webhook/custom')
+async def custom_webhook(request: Request):
     """Handle custom webhook alerts"""
     try:
-        data = request.json
-        
-        # Extract custom alert data
-        symbol = data.get('symbol', '').upper()
-        action = data.get('action', '').upper()
-        price = float(data.get('price', 0))
-        quantity = int(data.get('quantity', 100))
-        broker = data.get('broker', 'dhan').lower()
+        data = orjson.loads(await request.body())
+        if not isinstance(data, dict):
+            logger.error("Invalid custom alert: expected a JSON object, got %s", type(data).__name__)
+            return ORJSONResponse({
+                'status': 'error',
+                'message': 'Invalid alert data'
+            }, status_code=400)
         
-        # Create alert data
-        alert_data = {
-            'symbol': symbol,
-            'action': action,
-            'price': price,
-            'quantity': quantity,
-            'broker': broker,
-            'strategy': 'Custom',
-            'confidence': 0.8
-        }
+        # Fill custom defaults in place on the parsed body
+        data.setdefault('strategy', 'Custom')
+        data.setdefault('confidence', 0.8)
+        alert_data = AlertMsg.model_validate(data)
         
-        # Process using TradingView handler
+        # Hand the alert to the worker thread
         if trading_engine:
-            handler = TradingViewAlertHandler(trading_engine)
-            signal = handler.process_alert(alert_data)
-            
-            if signal:
-                trading_engine.signal_queue.put(signal)
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Custom signal processed: {symbol} {action}'
-                })
+            signal_id = _signal_counter()
+            alert_deque.append((signal_id, alert_data))
+            _alert_ready.set()
+            return ORJSONResponse({
+                'status': 'queued',
+                'signal_id': signal_id,
+                'message': f'Custom signal queued: {alert_data.symbol} {alert_data.action}'
+            }, status_code=202)
         
-        return jsonify({
+        return ORJSONResponse({
             'status': 'error',
             'message': 'Failed to process custom alert'
-        }), 400
+        }, status_code=400)
         
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        logger.error("Invalid custom alert: %s", e)
+        return ORJSONResponse({
+            'status': 'error',
+            'message': 'Invalid alert data'
+        }, status_code=400)
     except Exception as e:
-        logger.error(f"Error handling custom webhook: {e}")
-        return jsonify({
+        logger.error("Error handling custom webhook: %s", e)
+        return ORJSONResponse({
             'status': 'error',
-            'message': str(e)
-        }), 500
+            'message': 'Internal server error'
+        }, status_code=500)
 
-@app.route('/status', methods=['GET'])
-def status():
+@app.get('/status')
+async def status():
     """Get trading engine status"""
     if trading_engine:
         portfolio = trading_engine.get_portfolio_summary()
-        return jsonify({
+        return ORJSONResponse({
             'status': 'running',
             'total_positions': portfolio['total_positions'],
             'total_pnl': portfolio['total_pnl'],
@@ -236,111 +319,69 @@ def status():
             'positions': portfolio['positions']
         })
     else:
-        return jsonify({
+        return ORJSONResponse({
             'status': 'stopped',
             'message': 'Trading engine not running'
         })
 
-@app.route('/health', methods=['GET'])
-def health():
+@app.get('/health')
+async def health():
     """Health check endpoint"""
-    return jsonify({
+    return ORJSONResponse({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '1.0.0'
     })
 
-def start_webhook_server(host='0.0.0.0', port=5000):
-    """Start the webhook server"""
-    logger.info(f"🌐 Starting webhook server on {host}:{port}")
-    app.run(host=host, port=port, debug=False)
-
-def create_tradingview_alert_example():
-    """Create example TradingView alert configuration"""
-    example_alert = {
-        "webhook_url": "http://your-server:5000/webhook/tradingview",
-        "alert_message": """
-        {
-            "symbol": "NIFTY50",
-            "action": "BUY",
-            "price": {{close}},
-            "quantity": 100,
-            "stop_loss": {{close * 0.98}},
-            "take_profit": {{close * 1.02}},
-            "strategy": "Momentum",
-            "confidence": 0.8,
-            "broker": "dhan"
-        }
-        """,
-        "tradingview_pine_script": """
-        //@version=5
-        strategy("Advanced Intraday Trading", overlay=true)
+def _alert_worker():
+    """Convert queued webhook alerts into signals for the trading engine"""
+    while True:
+        _alert_ready.wait()
+        # Clear before draining so an alert appended mid-drain re-arms the event
+        _alert_ready.clear()
         
-        // Strategy parameters
-        rsi_length = input(14, "RSI Length")
-        rsi_overbought = input(70, "RSI Overbought")
-        rsi_oversold = input(30, "RSI Oversold")
-        
-        // Calculate RSI
-        rsi = ta.rsi(close, rsi_length)
-        
-        // Entry conditions
-        long_condition = rsi < rsi_oversold and close > close[1]
-        short_condition = rsi > rsi_overbought and close < close[1]
-        
-        // Strategy entries
-        if long_condition
-            strategy.entry("Long", strategy.long)
-            alert("BUY Signal", alert.freq_once_per_bar)
-        
-        if short_condition
-            strategy.entry("Short", strategy.short)
-            alert("SELL Signal", alert.freq_once_per_bar)
-        
-        // Plot signals
-        plotshape(long_condition, "Buy Signal", shape.triangleup, location.belowbar, color.green, size=size.small)
-        plotshape(short_condition, "Sell Signal", shape.triangledown, location.abovebar, color.red, size=size.small)
-        """
-    }
-    
-    return example_alert
+        while alert_deque:
+            signal_id, alert_data = alert_deque.popleft()
+            try:
+                signal = alert_handler.process_alert(alert_data)
+                
+                if signal:
+                    trading_engine.signal_queue.put(signal)
+                    logger.info("🚀 Signal #%d queued for execution: %s %s", signal_id, signal.symbol, signal.side.value)
+                else:
+                    logger.warning("Signal #%d dropped: alert could not be converted", signal_id)
+            except Exception:
+                # Keep the worker alive so later alerts are still processed
+                logger.exception("Error handling queued signal #%d", signal_id)
+
+def start_webhook_server(host='0.0.0.0', port=5000):
+    """Start the webhook server (uvloop/httptools are picked up when installed)"""
+    logger.info("🌐 Starting webhook server on %s:%s", host, port)
+    uvicorn.run(
+        app, host=host, port=port, loop='auto', http='auto', workers=1,
+        backlog=2048, timeout_keep_alive=30
+    )
 
 def main():
     """Main function to run the TradingView alert handler"""
-    global trading_engine
-    
     logger.info("🚀 Starting TradingView Alert Handler")
     
-    # Initialize trading engine
-    try:
-        trading_engine = AdvancedTradingEngine(CONFIG.__dict__)
-        logger.info("✅ Trading engine initialized")
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize trading engine: {e}")
-        return
-    
-    # Start trading engine in background
-    def run_trading_engine():
-        import asyncio
-        asyncio.run(trading_engine.start_trading())
-    
-    trading_thread = threading.Thread(target=run_trading_engine, daemon=True)
-    trading_thread.start()
-    
-    # Start webhook server
+    # Start webhook server (the lifespan hook starts the trading engine)
     try:
         start_webhook_server()
     except KeyboardInterrupt:
         logger.info("🛑 Shutting down TradingView Alert Handler")
     except Exception as e:
-        logger.error(f"❌ Error running webhook server: {e}")
+        logger.error("❌ Error running webhook server: %s", e)
 
 if __name__ == "__main__":
     # Print example configuration
     print("📋 TradingView Alert Configuration Example:")
     print("=" * 50)
+    from tradingview_examples import create_tradingview_alert_example
     example = create_tradingview_alert_example()
     print(f"Webhook URL: {example['webhook_url']}")
+    print(f"Signature: {example['signature']}")
     print("\nAlert Message (JSON):")
     print(example['alert_message'])
     print("\nTradingView Pine Script:")
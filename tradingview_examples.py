@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Example TradingView alert configuration for tradingview_alerts.py
+Kept out of the webhook module so the server does not load it on import
+"""
+
+def create_tradingview_alert_example():
+    """Create example TradingView alert configuration"""
+    example_alert = {
+        "webhook_url": "http://your-server:5000/webhook/tradingview",
+        "signature": (
+            "When WEBHOOK_SECRET is set, the sender (a relay in front of TradingView) must put the "
+            "hex MAC of the raw body in the X-Signature header: HMAC-SHA256 keyed with the secret, "
+            "or BLAKE2b with key=secret and digest_size=32 when WEBHOOK_MAC=blake2b"
+        ),
+        "alert_message": """
+        {
+            "symbol": "NIFTY50",
+            "action": "BUY",
+            "price": {{close}},
+            "quantity": 100,
+            "stop_loss": {{close * 0.98}},
+            "take_profit": {{close * 1.02}},
+            "strategy": "Momentum",
+            "confidence": 0.8,
+            "broker": "dhan"
+        }
+        """,
+        "tradingview_pine_script": """
+        //@version=5
+        strategy("Advanced Intraday Trading", overlay=true)
+        
+        // Strategy parameters
+        rsi_length = input(14, "RSI Length")
+        rsi_overbought = input(70, "RSI Overbought")
+        rsi_oversold = input(30, "RSI Oversold")
+        
+        // Calculate RSI
+        rsi = ta.rsi(close, rsi_length)
+        
+        // Entry conditions
+        long_condition = rsi < rsi_oversold and close > close[1]
+        short_condition = rsi > rsi_overbought and close < close[1]
+        
+        // Strategy entries
+        if long_condition
+            strategy.entry("Long", strategy.long)
+            alert("BUY Signal", alert.freq_once_per_bar)
+        
+        if short_condition
+            strategy.entry("Short", strategy.short)
+            alert("SELL Signal", alert.freq_once_per_bar)
+        
+        // Plot signals
+        plotshape(long_condition, "Buy Signal", shape.triangleup, location.belowbar, color.green, size=size.small)
+        plotshape(short_condition, "Sell Signal", shape.triangledown, location.abovebar, color.red, size=size.small)
+        """
+    }
+    
+    return example_alert